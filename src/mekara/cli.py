@@ -11,6 +11,7 @@ import os
 import re
 import sys
 from pathlib import Path
+from typing import Any
 
 import click
 
@@ -135,37 +136,49 @@ def build_dev_mode_system_prompt() -> str:
     )
 
 
+# Commands known by name to affect .mekara/scripts/nl/
+_MEKARA_AFFECTING_NAME_PATTERN = re.compile(
+    r"systematize|standardize|recursive-self-improvement|rsi[-/]", re.IGNORECASE
+)
+# Script content referencing these directories creates or modifies files in them.
+# Case-insensitive search scans the file once without building a lowercased copy.
+_MEKARA_AFFECTING_CONTENT_PATTERN = re.compile(rb"\.mekara|\.claude", re.IGNORECASE)
+
+
 def _command_affects_mekara_dir(command_name: str, target_path: Path) -> bool:
     """Check if a command affects the script directory.
 
     Checks both the command name and file content for patterns that indicate
     the command creates or modifies files in .mekara/.
     """
-    # Commands known by name to affect .mekara/scripts/nl/
-    name_patterns = [
-        "systematize",
-        "standardize",
-        "recursive-self-improvement",
-        "rsi-",
-        "rsi/",
-    ]
-    name_lower = command_name.lower()
-    if any(pattern in name_lower for pattern in name_patterns):
+    if _MEKARA_AFFECTING_NAME_PATTERN.search(command_name):
         return True
 
-    # Check file content for .mekara/ directory operations
+    # Check file content for .mekara/ directory operations. The patterns are ASCII,
+    # so scan the raw bytes rather than decoding the whole file.
     try:
-        content = target_path.read_text()
+        content = target_path.read_bytes()
     except (OSError, IOError):
         return False
 
-    content_patterns = [
-        ".mekara",
-        ".claude",
-    ]
+    return _MEKARA_AFFECTING_CONTENT_PATTERN.search(content) is not None
 
-    content_lower = content.lower()
-    return any(pattern in content_lower for pattern in content_patterns)
+
+def _normalize_command_name(name: str) -> str:
+    """Convert a command/skill name as typed in Claude Code into a mekara script name.
+
+    Leading slashes are stripped (handles the // case) and colons, which Claude Code
+    may use as path separators, become slashes for mekara resolution.
+    """
+    return name.lstrip("/").replace(":", "/")
+
+
+def _read_hook_input() -> dict[str, Any] | None:
+    """Parse the hook's JSON payload from stdin, or return None if it is not valid JSON."""
+    try:
+        return json.load(sys.stdin)
+    except json.JSONDecodeError:
+        return None
 
 
 def _hook_pre_tool_use() -> int:
@@ -177,11 +190,8 @@ def _hook_pre_tool_use() -> int:
     """
     from mekara.scripting.resolution import Script, resolve_target
 
-    # Read hook input from stdin (JSON format)
-    stdin_content = sys.stdin.read()
-    try:
-        input_data = json.loads(stdin_content)
-    except json.JSONDecodeError:
+    input_data = _read_hook_input()
+    if input_data is None:
         return 0
 
     # Only handle Skill tool
@@ -195,8 +205,7 @@ def _hook_pre_tool_use() -> int:
     if not skill_name:
         return 0
 
-    # Normalize: convert colons to slashes for mekara resolution
-    skill_name_normalized = skill_name.replace(":", "/")
+    skill_name_normalized = _normalize_command_name(skill_name)
 
     # Check if this is a compiled mekara script
     target = resolve_target(skill_name_normalized)
@@ -223,6 +232,20 @@ def _hook_pre_tool_use() -> int:
     return 0
 
 
+# Bash commands that still need user approval: rm or git commit, after leading whitespace.
+_REQUIRES_APPROVAL_PATTERN = re.compile(r"\s*(?:rm |git commit)")
+
+# The allow decision never varies, so serialize it once at import.
+_AUTO_APPROVE_OUTPUT = json.dumps(
+    {
+        "hookSpecificOutput": {
+            "hookEventName": "PreToolUse",
+            "permissionDecision": "allow",
+        }
+    }
+)
+
+
 def _hook_auto_approve() -> int:
     """Handle PreToolUse hook - auto-approve all actions except rm and git commit.
 
@@ -230,11 +253,8 @@ def _hook_auto_approve() -> int:
     except for bash commands that start with 'rm' or 'git commit', which still
     require user approval for safety.
     """
-    # Read hook input from stdin (JSON format)
-    stdin_content = sys.stdin.read()
-    try:
-        input_data = json.loads(stdin_content)
-    except json.JSONDecodeError:
+    input_data = _read_hook_input()
+    if input_data is None:
         return 0
 
     # Get the tool name and input
@@ -244,22 +264,14 @@ def _hook_auto_approve() -> int:
     # Check if this is a Bash command
     if tool_name == "Bash":
         command = tool_input.get("command", "")
-        # Strip leading whitespace and check if command starts with blocked patterns
-        command_stripped = command.lstrip()
 
         # Block (don't auto-approve) commands starting with rm or git commit
-        if command_stripped.startswith("rm ") or command_stripped.startswith("git commit"):
+        if _REQUIRES_APPROVAL_PATTERN.match(command):
             # Return empty JSON - let normal permission flow handle it
             return 0
 
     # Auto-approve everything else
-    output = {
-        "hookSpecificOutput": {
-            "hookEventName": "PreToolUse",
-            "permissionDecision": "allow",
-        }
-    }
-    print(json.dumps(output))
+    print(_AUTO_APPROVE_OUTPUT)
     return 0
 
 
@@ -268,11 +280,8 @@ def _hook_user_prompt_submit() -> int:
     from mekara.scripting.loading import load_script
     from mekara.scripting.resolution import Script, resolve_target
 
-    # Read hook input from stdin (JSON format)
-    stdin_content = sys.stdin.read()
-    try:
-        input_data = json.loads(stdin_content)
-    except json.JSONDecodeError:
+    input_data = _read_hook_input()
+    if input_data is None:
         return 0
 
     # Get the user's prompt
@@ -287,32 +296,28 @@ def _hook_user_prompt_submit() -> int:
     if not match:
         return 0
 
-    command_name = match.group(1)
-    # Strip any leading slash from the command name (handles // case)
-    command_name = command_name.lstrip("/")
+    command_name_normalized = _normalize_command_name(match.group(1))
     arguments = match.group(2) or ""
 
-    # Normalize: convert colons to slashes for mekara resolution
-    command_name_normalized = command_name.replace(":", "/")
-
     # Use mekara's resolution logic to check what type of command this is
     target = resolve_target(command_name_normalized)
 
     if target is None:
         return 0
 
-    # Dev mode: output system prompt if command affects .mekara/ directory
-    is_dev_mode = _env_bool(MEKARA_DEV_ENV)
-    affects_dot_mekara = _command_affects_mekara_dir(command_name_normalized, target.nl.path)
-    if is_dev_mode and affects_dot_mekara:
+    # Dev mode: output system prompt if command affects .mekara/ directory.
+    # Check dev mode first so ordinary prompts never read the script file.
+    if _env_bool(MEKARA_DEV_ENV) and _command_affects_mekara_dir(
+        command_name_normalized, target.nl.path
+    ):
         print(f"<dev-mode>\n{build_dev_mode_system_prompt()}\n</dev-mode>")
 
     # For bundled natural-language commands (not available as Claude commands),
     # output the entire command content with $ARGUMENTS replaced and standards injected
     if target.is_bundled and target.is_nl:
         loaded = load_script(command_name_normalized, arguments)
-        print(f"<command-name>/{command_name_normalized}</command-name>")
-        print(loaded.prompt)
+        # One write for the tag and the (potentially large) content
+        print(f"<command-name>/{command_name_normalized}</command-name>\n{loaded.prompt}")
         return 0
 
     # Only output MCP instructions for compiled scripts
@@ -455,6 +460,24 @@ def _install_hooks() -> int:
     return 0
 
 
+def _write_if_changed(target_file: Path, data: bytes) -> bool:
+    """Write data to target_file unless it already holds exactly those bytes.
+
+    The size check lets changed files skip reading the old content, and parent
+    directories are only created when the target does not exist yet.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+    """
+    try:
+        if target_file.stat().st_size == len(data) and target_file.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+    target_file.write_bytes(data)
+    return True
+
+
 def _install_commands() -> int:
     """Install bundled commands, scripts, and standards to ~/.mekara/.
 
@@ -495,14 +518,8 @@ def _install_commands() -> int:
         for source_file in standards_source.rglob("*.md"):
             relative_path = source_file.relative_to(standards_source)
             target_file = mekara_standards_dir / relative_path
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-
-            content = source_file.read_text()
-            if target_file.exists() and target_file.read_text() == content:
-                continue
-
-            target_file.write_text(content)
-            standards_copied += 1
+            if _write_if_changed(target_file, source_file.read_bytes()):
+                standards_copied += 1
 
         if standards_copied > 0:
             print(f"Installed {standards_copied} standards to {mekara_standards_dir}")
@@ -516,15 +533,10 @@ def _install_commands() -> int:
         for source_file in scripts_source.rglob("*.py"):
             relative_path = source_file.relative_to(scripts_source)
             target_file = mekara_compiled_dir / relative_path
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-
-            content = source_file.read_text()
-            if target_file.exists() and target_file.read_text() == content:
+            if _write_if_changed(target_file, source_file.read_bytes()):
+                scripts_copied += 1
+            else:
                 scripts_skipped += 1
-                continue
-
-            target_file.write_text(content)
-            scripts_copied += 1
 
         print(f"Installed {scripts_copied} compiled scripts to {mekara_compiled_dir}")
         if scripts_skipped > 0:
@@ -574,11 +586,8 @@ def _install_commands() -> int:
         relative_path = source_file.relative_to(commands_source)
         target_file = canonical_dir / relative_path
 
-        # Create parent directories if needed
-        target_file.parent.mkdir(parents=True, exist_ok=True)
-
         # Read and transform content
-        content = source_file.read_text()
+        content = source_file.read_text(encoding="utf-8")
         # Replace @standard:name with file path for Claude Code's @ reference
         content = re.sub(
             r"@standard:(\w+)",
@@ -586,15 +595,11 @@ def _install_commands() -> int:
             content,
         )
 
-        # Check if file exists and has same content
-        if target_file.exists():
-            if target_file.read_text() == content:
-                skipped_count += 1
-                continue
-
-        # Write the transformed file
-        target_file.write_text(content)
-        copied_count += 1
+        # Write the transformed file unless it is already up to date
+        if _write_if_changed(target_file, content.encode("utf-8")):
+            copied_count += 1
+        else:
+            skipped_count += 1
 
     print(f"Installed {copied_count} commands to {canonical_dir}")
     if skipped_count > 0:
@@ -363,6 +363,7 @@ def run_server() -> None:
 
     # Check for VCR cassette env var
     cassette_path = os.environ.get(MEKARA_VCR_CASSETTE_ENV)
+    cassette: VCRCassette | None = None
     if cassette_path:
         # Use VCR wrapper - always record mode when env var is set
         working_dir = find_project_root() or Path.cwd()
@@ -382,7 +383,13 @@ def run_server() -> None:
     mcp.tool()(server.status)
     mcp.tool()(server.write_bundled)
 
-    mcp.run(transport="stdio")
+    try:
+        mcp.run(transport="stdio")
+    finally:
+        if cassette is not None:
+            # Persist events from trailing calls (e.g. status) that do not save on their own,
+            # including when the server exits on an exception or interrupt.
+            cassette.save()
 
 
 if __name__ == "__main__":
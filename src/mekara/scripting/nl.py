@@ -24,8 +24,11 @@ def build_nl_command_prompt(command_content: str, request: str) -> str:
     # This allows scripts to reference $ARGUMENTS in documentation/instructions
     # without those references being substituted (e.g., compile.md explains
     # how $ARGUMENTS works, but only the first occurrence is the actual usage).
-    if "$ARGUMENTS" in command_content:
-        command_content = command_content.replace("$ARGUMENTS", request, 1)
+    # partition() finds the first occurrence in a single scan; content without the
+    # placeholder is left untouched.
+    head, placeholder, tail = command_content.partition("$ARGUMENTS")
+    if placeholder:
+        command_content = head + request + tail
 
     # Detect @standard:name references and inject standards content
     command_content = _inject_standards(command_content)
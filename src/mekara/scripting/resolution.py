@@ -15,6 +15,7 @@ Precedence levels (first match wins):
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -33,7 +34,7 @@ class Script(str, Enum):
     NATURAL_LANGUAGE = "natural_language"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScriptInfo:
     """Info about a single script file (compiled or NL)."""
 
@@ -41,7 +42,7 @@ class ScriptInfo:
     is_bundled: bool
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedTarget:
     """Represents a resolved script or command target.
 
@@ -125,13 +126,14 @@ def resolve_target(name: str) -> ResolvedTarget | None:
     Returns:
         A ResolvedTarget if found, or None if no matching target exists.
     """
-    nl_match = _find_highest_precedence(_NL_SCRIPT_LEVELS, name)
+    candidates = _name_variants(name)
+    nl_match = _find_highest_precedence(_NL_SCRIPT_LEVELS, candidates)
     if nl_match is None:
         return None
 
     # Slice to nl_match.found_index+1: compiled must be at same or higher precedence than NL.
     levels = _COMPILED_SCRIPT_LEVELS[: nl_match.found_index + 1]
-    compiled_match = _find_highest_precedence(levels, name)
+    compiled_match = _find_highest_precedence(levels, candidates)
 
     nl_info = ScriptInfo(
         path=nl_match.path,
@@ -153,24 +155,34 @@ def resolve_target(name: str) -> ResolvedTarget | None:
     )
 
 
+def _name_variants(name: str) -> tuple[str, ...]:
+    """Filesystem spellings to try for a name: as given first, then with underscores.
+
+    Names without hyphens have no distinct underscored form, so the same path is not
+    probed twice.
+    """
+    underscored_name = name.replace("-", "_")
+    return (name,) if underscored_name == name else (name, underscored_name)
+
+
 def _find_highest_precedence(
     levels: list[SearchLevel],
-    filename: str,
+    candidates: tuple[str, ...],
 ) -> Match | None:
     """Find a file at the first matching level in precedence order.
 
     Args:
         levels: List of SearchLevel in precedence order (first = highest).
-        filename: Script name without suffix; hyphens tried first, underscores as fallback.
+        candidates: Name variants without suffix, in preference order (see _name_variants).
 
     Returns:
         Match with index and path if found, or None.
     """
+    # Probe plain strings and only build a Path for the match that is returned.
     for i, level in enumerate(levels):
-        exact = level.directory / f"{filename}{level.extension}"
-        if exact.exists():
-            return Match(found_index=i, path=exact)
-        underscored = level.directory / f"{filename.replace('-', '_')}{level.extension}"
-        if underscored.exists():
-            return Match(found_index=i, path=underscored)
+        directory = os.fspath(level.directory)
+        for candidate in candidates:
+            path = os.path.join(directory, candidate + level.extension)
+            if os.path.exists(path):
+                return Match(found_index=i, path=Path(path))
     return None
@@ -14,6 +14,7 @@ from mekara.scripting.resolution import (
     _LEVEL_DIRS,
     SearchLevel,
     _find_highest_precedence,
+    _name_variants,
 )
 
 # Derived from _LEVEL_DIRS, same as NL/compiled level lists but for standards.
@@ -59,7 +60,7 @@ def resolve_standard(name: str) -> Path | None:
     Returns:
         Path to the standard file, or None if not found.
     """
-    result = _find_highest_precedence(_STANDARDS_LEVELS, name)
+    result = _find_highest_precedence(_STANDARDS_LEVELS, _name_variants(name))
     return result.path if result is not None else None
 
 
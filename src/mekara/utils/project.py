@@ -7,8 +7,18 @@ scripts and commands regardless of the current working directory.
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
+# Directory names whose presence marks a project root.
+_PROJECT_MARKERS = (".mekara", ".claude")
+
+# The bundled tree ships inside the package, so its location is fixed at import time.
+_BUNDLED_DIR = Path(__file__).parent.parent / "bundled"
+_BUNDLED_SCRIPTS_DIR = _BUNDLED_DIR / "scripts" / "compiled"
+_BUNDLED_COMMANDS_DIR = _BUNDLED_DIR / "scripts" / "nl"
+_BUNDLED_STANDARDS_DIR = _BUNDLED_DIR / "standards"
+
 
 def find_project_root(start_dir: Path | None = None) -> Path | None:
     """Find the project root by walking up the directory tree.
@@ -19,17 +29,17 @@ def find_project_root(start_dir: Path | None = None) -> Path | None:
     Returns:
         Path to project root (containing .mekara or .claude), or None if not found
     """
-    current = start_dir or Path.cwd()
-    current = current.resolve()
+    # Walk plain strings and only build a Path for the root that is returned
+    current = os.path.realpath(start_dir or os.getcwd())
 
     # Walk up the directory tree
     while True:
         # Check for .mekara or .claude directory
-        if (current / ".mekara").exists() or (current / ".claude").exists():
-            return current
+        if any(os.path.isdir(os.path.join(current, name)) for name in _PROJECT_MARKERS):
+            return Path(current)
 
         # Check if we've reached the filesystem root
-        parent = current.parent
+        parent = os.path.dirname(current)
         if parent == current:
             # We've reached the root without finding a project directory
             return None
@@ -91,8 +101,7 @@ def bundled_scripts_dir() -> Path:
     Returns:
         Path to bundled/scripts/compiled/ in the installed mekara package
     """
-    # Go up from utils/ to mekara/ to find bundled/scripts/
-    return Path(__file__).parent.parent / "bundled" / "scripts" / "compiled"
+    return _BUNDLED_SCRIPTS_DIR
 
 
 def bundled_commands_dir() -> Path:
@@ -101,8 +110,7 @@ def bundled_commands_dir() -> Path:
     Returns:
         Path to bundled/scripts/nl/ in the installed mekara package
     """
-    # Go up from utils/ to mekara/ to find bundled/scripts/
-    return Path(__file__).parent.parent / "bundled" / "scripts" / "nl"
+    return _BUNDLED_COMMANDS_DIR
 
 
 def user_scripts_dir() -> Path:
@@ -129,7 +137,7 @@ def bundled_standards_dir() -> Path:
     Returns:
         Path to bundled/standards/ in the installed mekara package
     """
-    return Path(__file__).parent.parent / "bundled" / "standards"
+    return _BUNDLED_STANDARDS_DIR
 
 
 def user_standards_dir() -> Path:
@@ -5,6 +5,7 @@ This module contains the VCR implementation of the `AutoExecutorProtocol` bounda
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 from typing import Any, AsyncIterator
 
@@ -135,4 +136,4 @@ class VcrAutoExecutor:
                     working_dir=working_dir,
                 )
             )
-            self._cassette.save()
+            await asyncio.to_thread(self._cassette.save)
@@ -8,6 +8,7 @@ to persist progress during recording.
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any, Literal, TypeVar, overload
 
@@ -37,6 +38,10 @@ def _represent_str(dumper: yaml.Dumper, data: str) -> yaml.Node:
 
 yaml.add_representer(str, _represent_str)
 
+# libyaml's C loader parses large cassettes several times faster than pure Python.
+# PyYAML builds without libyaml only provide the pure-Python loader.
+SafeLoader = yaml.CSafeLoader if yaml.__with_libyaml__ else yaml.SafeLoader
+
 CassetteMode = Literal["record", "replay"]
 
 T = TypeVar(
@@ -77,6 +82,9 @@ class VCRCassette:
         self._events: list[VcrEvent] = []
         self._replay_event_index = 0
         self._last_saved_event_count = 0
+        self._header_written = False
+        # save() may run on a worker thread (see VcrMekaraServer); serialize writers.
+        self._save_lock = threading.Lock()
 
         if mode == "record":
             if initial_state is None:
@@ -89,7 +97,7 @@ class VCRCassette:
             self._load()
 
     def _load(self) -> None:
-        data = yaml.safe_load(self.path.read_text()) if self.path.exists() else {}
+        data = yaml.load(self.path.read_bytes(), Loader=SafeLoader) if self.path.exists() else {}
 
         raw_events = data.get("events")
         if raw_events is None:
@@ -187,42 +195,54 @@ class VCRCassette:
 
         The save format records boundary-level SDK inputs and outputs for replay.
         Only appends new events since the last save to avoid O(n²) rewriting.
+
+        Async boundaries (VcrMekaraServer's async tools, VcrAutoExecutor) call this via
+        asyncio.to_thread. Synchronous boundaries (VcrFilesystemAccess, write_bundled)
+        cannot await and call it directly; the lock serializes them with any save
+        already running on a worker thread.
         """
         if self.mode != "record":
             return
 
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-
-        # First save: write the full file including initial_state header
-        if self._last_saved_event_count == 0:
-            data = {
-                "initial_state": self.initial_state,
-                "events": [e.to_dict() for e in self._events],
-            }
-            self.path.write_text(
-                yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
-            )
-            self._last_saved_event_count = len(self._events)
-            return
-
-        # Subsequent saves: only append new events
-        new_events = self._events[self._last_saved_event_count :]
-        if not new_events:
-            return
-
-        # Append new events to the YAML file
-        with self.path.open("a", encoding="utf-8") as f:
-            for event in new_events:
-                # Indent the event dict to match YAML list syntax
-                event_dict = event.to_dict()
-                event_yaml = yaml.dump(
-                    event_dict, default_flow_style=False, allow_unicode=True, sort_keys=False
+        with self._save_lock:
+            # Snapshot the count so events recorded while writing are left for the next save.
+            saved_count = len(self._events)
+            # Nothing new since the last save: skip serialization and all filesystem calls.
+            if self._header_written and saved_count == self._last_saved_event_count:
+                return
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+
+            # First save (or nothing appended yet): write the full file including
+            # initial_state header, since "events: []" cannot be appended to.
+            if self._last_saved_event_count == 0:
+                data = {
+                    "initial_state": self.initial_state,
+                    "events": [e.to_dict() for e in self._events[:saved_count]],
+                }
+                self.path.write_text(
+                    yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
                 )
-                # Add list item prefix and proper indentation
-                for line in event_yaml.rstrip("\n").split("\n"):
-                    if line == event_yaml.split("\n")[0]:
-                        f.write(f"- {line}\n")
-                    else:
-                        f.write(f"  {line}\n")
-
-        self._last_saved_event_count = len(self._events)
+                self._header_written = True
+                self._last_saved_event_count = saved_count
+                return
+
+            # Subsequent saves: only append new events
+            new_events = self._events[self._last_saved_event_count : saved_count]
+
+            # Append new events to the YAML file
+            with self.path.open("a", encoding="utf-8") as f:
+                for event in new_events:
+                    # Indent the event dict to match YAML list syntax
+                    event_yaml = yaml.dump(
+                        event.to_dict(),
+                        default_flow_style=False,
+                        allow_unicode=True,
+                        sort_keys=False,
+                    )
+                    # Add list item prefix and proper indentation
+                    first_line, *rest = event_yaml.rstrip("\n").split("\n")
+                    f.write(f"- {first_line}\n")
+                    f.writelines(f"  {line}\n" for line in rest)
+
+            self._last_saved_event_count = saved_count
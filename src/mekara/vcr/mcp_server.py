@@ -10,6 +10,8 @@ Replay mode: wraps SAME real MekaraServer with VcrAutoExecutor (no inner).
 
 from __future__ import annotations
 
+import asyncio
+import difflib
 from pathlib import Path
 from typing import Any
 
@@ -28,6 +30,16 @@ from mekara.vcr.events import (
 )
 from mekara.vcr.filesystem import VcrFilesystemAccess
 
+# Mismatch errors show at most this many characters of each output; the diff carries the rest.
+_MISMATCH_PREVIEW_CHARS = 512
+
+
+def _preview(text: str) -> str:
+    """Return the repr of text, truncated to _MISMATCH_PREVIEW_CHARS with an ellipsis."""
+    if len(text) <= _MISMATCH_PREVIEW_CHARS:
+        return repr(text)
+    return f"{text[:_MISMATCH_PREVIEW_CHARS]!r}..."
+
 
 class VcrMekaraServer:
     """VCR wrapper for MekaraServer.
@@ -63,6 +75,28 @@ class VcrMekaraServer:
                 working_dir=replay_working_dir,
             )
 
+    def _verify_output(self, tool: str, response: str) -> None:
+        """Consume the recorded mcp_tool_output and raise if the replayed response differs."""
+        output_event = self._cassette.consume_event(McpToolOutputEvent)
+        if response == output_event.output:
+            return
+        diff = "\n".join(
+            difflib.unified_diff(
+                output_event.output.splitlines(),
+                response.splitlines(),
+                fromfile="recorded",
+                tofile="replayed",
+                lineterm="",
+            )
+        )
+        raise ValueError(
+            f"VCR replay error: {tool}() output mismatch.\n"
+            f"Expected: {_preview(output_event.output)}\n"
+            f"Got: {_preview(response)}\n"
+            f"Diff:\n{diff}\n"
+            "Re-record the cassette if outputs have changed."
+        )
+
     async def start(self, name: str, arguments: str = "", working_dir: str | None = None) -> str:
         """Start executing a mekara script with VCR recording.
 
@@ -75,7 +109,7 @@ class VcrMekaraServer:
             )
             response = await self._inner.start(name, arguments, working_dir)
             self._cassette.record_event(McpToolOutputEvent(tool="start", output=response))
-            self._cassette.save()
+            await asyncio.to_thread(self._cassette.save)
             return response
         else:
             # Replay: run real application code (VcrAutoExecutor handles auto_step events)
@@ -83,14 +117,7 @@ class VcrMekaraServer:
             response = await self._inner.start(name, arguments, working_dir)
 
             # Consume mcp_tool_output and verify output matches recorded
-            output_event = self._cassette.consume_event(McpToolOutputEvent)
-            if response != output_event.output:
-                raise ValueError(
-                    f"VCR replay error: start() output mismatch.\n"
-                    f"Expected: {output_event.output!r}\n"
-                    f"Got: {response!r}\n"
-                    "Re-record the cassette if outputs have changed."
-                )
+            self._verify_output("start", response)
             return response
 
     async def continue_compiled_script(self, outputs: dict[str, Any]) -> str:
@@ -105,7 +132,7 @@ class VcrMekaraServer:
             self._cassette.record_event(
                 McpToolOutputEvent(tool="continue_compiled_script", output=response)
             )
-            self._cassette.save()
+            await asyncio.to_thread(self._cassette.save)
             return response
         else:
             # Replay: run real application code (VcrAutoExecutor handles auto_step events)
@@ -113,14 +140,7 @@ class VcrMekaraServer:
             response = await self._inner.continue_compiled_script(outputs)
 
             # Consume mcp_tool_output and verify output matches recorded
-            output_event = self._cassette.consume_event(McpToolOutputEvent)
-            if response != output_event.output:
-                raise ValueError(
-                    f"VCR replay error: continue_compiled_script() output mismatch.\n"
-                    f"Expected: {output_event.output!r}\n"
-                    f"Got: {response!r}\n"
-                    "Re-record the cassette if outputs have changed."
-                )
+            self._verify_output("continue_compiled_script", response)
             return response
 
     def status(self) -> str:
@@ -133,7 +153,8 @@ class VcrMekaraServer:
             self._cassette.record_event(McpStatusInputEvent())
             response = self._inner.status()
             self._cassette.record_event(McpToolOutputEvent(tool="status", output=response))
-            self._cassette.save()
+            # No save here: status is a cheap polling call, so its events ride along with
+            # the next tool call's save (or the final save when the server shuts down).
             return response
         else:
             # Replay: run real application code
@@ -141,14 +162,7 @@ class VcrMekaraServer:
             response = self._inner.status()
 
             # Consume mcp_tool_output and verify output matches recorded
-            output_event = self._cassette.consume_event(McpToolOutputEvent)
-            if response != output_event.output:
-                raise ValueError(
-                    f"VCR replay error: status() output mismatch.\n"
-                    f"Expected: {output_event.output!r}\n"
-                    f"Got: {response!r}\n"
-                    "Re-record the cassette if outputs have changed."
-                )
+            self._verify_output("status", response)
             return response
 
     async def finish_nl_script(self) -> str:
@@ -163,7 +177,7 @@ class VcrMekaraServer:
             self._cassette.record_event(
                 McpToolOutputEvent(tool="finish_nl_script", output=response)
             )
-            self._cassette.save()
+            await asyncio.to_thread(self._cassette.save)
             return response
         else:
             # Replay: run real application code
@@ -171,14 +185,7 @@ class VcrMekaraServer:
             response = await self._inner.finish_nl_script()
 
             # Consume mcp_tool_output and verify output matches recorded
-            output_event = self._cassette.consume_event(McpToolOutputEvent)
-            if response != output_event.output:
-                raise ValueError(
-                    f"VCR replay error: finish_nl_script() output mismatch.\n"
-                    f"Expected: {output_event.output!r}\n"
-                    f"Got: {response!r}\n"
-                    "Re-record the cassette if outputs have changed."
-                )
+            self._verify_output("finish_nl_script", response)
             return response
 
     # Keep old name as alias for backwards compatibility
@@ -202,14 +209,6 @@ class VcrMekaraServer:
             # Replay: run real application code
             response = self._inner.write_bundled(name, force)
 
-            # Consume and verify MCP output
-            output_event = self._cassette.consume_event(McpToolOutputEvent)
-            if response != output_event.output:
-                raise ValueError(
-                    f"VCR replay error: write_bundled() output mismatch.\n"
-                    f"Expected: {output_event.output!r}\n"
-                    f"Got: {response!r}\n"
-                    "Re-record the cassette if outputs have changed."
-                )
-
+            # Consume mcp_tool_output and verify output matches recorded
+            self._verify_output("write_bundled", response)
             return response
@@ -5,5 +5,24 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+
+from mekara.scripting.auto import AutoExecutor
+from mekara.scripting.resolution import ResolvedTarget, resolve_target
+
 # Add scripts/ to the path so tests can import scripts directly (e.g. sync_nl).
 sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+
+@pytest.fixture(scope="session")
+def random_target() -> ResolvedTarget:
+    """The bundled test/random script, resolved once for the whole session."""
+    target = resolve_target("test/random")
+    assert target is not None, "test/random script not found"
+    return target
+
+
+@pytest.fixture(scope="session")
+def auto_executor() -> AutoExecutor:
+    """One real AutoExecutor for the session; it is stateless between calls."""
+    return AutoExecutor()
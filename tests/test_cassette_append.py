@@ -1,10 +1,15 @@
 """Test that incremental cassette saves produce identical YAML to full rewrites."""
 
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
+import pytest
 import yaml
 
-from mekara.vcr.cassette import VCRCassette
+from mekara.vcr import cassette as cassette_module
+from mekara.vcr.cassette import SafeLoader, VCRCassette
 from mekara.vcr.events import (
     McpContinueCompiledScriptInputEvent,
     McpStartInputEvent,
@@ -13,6 +18,19 @@ from mekara.vcr.events import (
 )
 
 
+@dataclass(frozen=True)
+class BlockingOutputEvent(McpToolOutputEvent):
+    """Tool output whose serialization pauses until the test releases it."""
+
+    entered: threading.Event = field(default_factory=threading.Event, compare=False)
+    release: threading.Event = field(default_factory=threading.Event, compare=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        self.entered.set()
+        assert self.release.wait(timeout=5)
+        return super().to_dict()
+
+
 def test_incremental_save_matches_full_rewrite(tmp_path: Path) -> None:
     """Verify that appending events produces the exact same YAML as rewriting the whole file."""
     # Create test initial_state
@@ -69,7 +87,7 @@ def test_incremental_save_matches_full_rewrite(tmp_path: Path) -> None:
     )
 
     # Also verify it can be loaded and parsed correctly
-    loaded = yaml.safe_load(incremental_path.read_text())
+    loaded = yaml.load(incremental_path.read_bytes(), Loader=SafeLoader)
     assert loaded["initial_state"] == initial_state
     assert loaded["events"] == event_dicts
 
@@ -113,3 +131,80 @@ def test_cassette_load_preserves_saved_count(tmp_path: Path) -> None:
     # The loaded cassette should know all events were already saved
     assert cassette2._last_saved_event_count == 2
     assert len(cassette2._events) == 2
+
+
+def test_save_without_events_writes_header_once(tmp_path: Path) -> None:
+    """Verify that an empty cassette is written once and later empty saves are no-ops."""
+    cassette_path = tmp_path / "test.yaml"
+    cassette = VCRCassette(
+        path=cassette_path, mode="record", initial_state={"working_dir": "/test"}
+    )
+
+    cassette.save()
+    assert yaml.load(cassette_path.read_bytes(), Loader=SafeLoader) == {
+        "initial_state": {"working_dir": "/test"},
+        "events": [],
+    }
+
+    cassette_path.unlink()
+    cassette.save()
+    assert not cassette_path.exists()
+
+    cassette.record_event(McpStatusInputEvent())
+    cassette.save()
+    loaded = yaml.load(cassette_path.read_bytes(), Loader=SafeLoader)
+    assert loaded["events"] == [McpStatusInputEvent().to_dict()]
+
+
+@pytest.mark.parametrize("saved_before", [False, True], ids=["full-write", "append"])
+def test_event_recorded_during_save_is_written_once(tmp_path: Path, saved_before: bool) -> None:
+    """An event recorded while another thread saves lands in the next save, exactly once."""
+    cassette_path = tmp_path / "test.yaml"
+    cassette = VCRCassette(
+        path=cassette_path, mode="record", initial_state={"working_dir": "/test"}
+    )
+    if saved_before:
+        cassette.record_event(McpStatusInputEvent())
+        cassette.save()
+    blocking = BlockingOutputEvent(tool="status", output="line 1\nline 2\n")
+    cassette.record_event(blocking)
+
+    saver = threading.Thread(target=cassette.save)
+    saver.start()
+    assert blocking.entered.wait(timeout=5)
+    cassette.record_event(McpToolOutputEvent(tool="status", output="recorded mid-save"))
+    blocking.release.set()
+    saver.join()
+    cassette.save()
+
+    expected = [McpStatusInputEvent().to_dict()] if saved_before else []
+    expected += [
+        McpToolOutputEvent(tool="status", output="line 1\nline 2\n").to_dict(),
+        McpToolOutputEvent(tool="status", output="recorded mid-save").to_dict(),
+    ]
+    loaded = yaml.load(cassette_path.read_bytes(), Loader=SafeLoader)
+    assert loaded["events"] == expected
+
+
+@pytest.mark.parametrize("loader", [yaml.SafeLoader, SafeLoader], ids=["pure-python", "default"])
+def test_replay_loads_with_either_loader(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, loader: type[Any]
+) -> None:
+    """Replay parses cassettes identically with the pure-Python and the default loader."""
+    cassette_path = tmp_path / "test.yaml"
+    events = [
+        McpStartInputEvent(name="a", arguments="", working_dir=None),
+        McpToolOutputEvent(tool="start", output="line 1\nline 2\n"),
+    ]
+    recorder = VCRCassette(
+        path=cassette_path, mode="record", initial_state={"working_dir": "/test"}
+    )
+    for event in events:
+        recorder.record_event(event)
+        recorder.save()
+
+    monkeypatch.setattr(cassette_module, "SafeLoader", loader)
+    replay = VCRCassette(cassette_path, mode="replay")
+
+    assert replay.get_working_dir() == Path("/test")
+    assert [replay.consume_event() for _ in events] == events
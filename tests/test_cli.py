@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -41,44 +41,42 @@ class TestMcpCommand:
 class TestInstallCommand:
     """Test the install command behavior."""
 
-    def test_install_no_subcommand_runs_both(self) -> None:
-        """mekara install with no subcommand should run both hooks and commands."""
-        with patch("mekara.cli._install_hooks", return_value=0) as mock_hooks:
-            with patch("mekara.cli._install_commands", return_value=0) as mock_commands:
-                result = main(["install"])
-                assert result == 0
-                mock_hooks.assert_called_once()
-                mock_commands.assert_called_once()
-
-    def test_install_hooks_runs_hooks_only(self) -> None:
-        """mekara install hooks should only run hooks install."""
-        with patch("mekara.cli._install_hooks", return_value=0) as mock_hooks:
-            with patch("mekara.cli._install_commands", return_value=0) as mock_commands:
-                result = main(["install", "hooks"])
-                assert result == 0
-                mock_hooks.assert_called_once()
-                mock_commands.assert_not_called()
-
-    def test_install_commands_runs_commands_only(self) -> None:
-        """mekara install commands should only run commands install."""
-        with patch("mekara.cli._install_hooks", return_value=0) as mock_hooks:
-            with patch("mekara.cli._install_commands", return_value=0) as mock_commands:
-                result = main(["install", "commands"])
-                assert result == 0
-                mock_hooks.assert_not_called()
-                mock_commands.assert_called_once()
-
-    def test_install_returns_max_error_code(self) -> None:
-        """Install with no subcommand should return max error code from both operations."""
-        with patch("mekara.cli._install_hooks", return_value=0):
-            with patch("mekara.cli._install_commands", return_value=1):
-                result = main(["install"])
-                assert result == 1
-
-        with patch("mekara.cli._install_hooks", return_value=2):
-            with patch("mekara.cli._install_commands", return_value=0):
-                result = main(["install"])
-                assert result == 2
+    @pytest.mark.parametrize(
+        ("argv", "hooks_rc", "commands_rc", "expected", "hooks_called", "commands_called"),
+        [
+            (["install"], 0, 0, 0, True, True),
+            (["install", "hooks"], 0, 0, 0, True, False),
+            (["install", "commands"], 0, 0, 0, False, True),
+            (["install"], 0, 1, 1, True, True),
+            (["install"], 2, 0, 2, True, True),
+        ],
+        ids=[
+            "no-subcommand-runs-both",
+            "hooks-only",
+            "commands-only",
+            "max-error-from-commands",
+            "max-error-from-hooks",
+        ],
+    )
+    def test_install_dispatch(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        argv: list[str],
+        hooks_rc: int,
+        commands_rc: int,
+        expected: int,
+        hooks_called: bool,
+        commands_called: bool,
+    ) -> None:
+        """mekara install runs the selected installers and returns the max error code."""
+        mock_hooks = Mock(return_value=hooks_rc)
+        mock_commands = Mock(return_value=commands_rc)
+        monkeypatch.setattr("mekara.cli._install_hooks", mock_hooks)
+        monkeypatch.setattr("mekara.cli._install_commands", mock_commands)
+
+        assert main(argv) == expected
+        assert mock_hooks.call_count == int(hooks_called)
+        assert mock_commands.call_count == int(commands_called)
 
 
 class TestHookCommand:
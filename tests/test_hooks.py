@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import io
 import json
 from pathlib import Path
-from unittest.mock import patch
+from typing import Any
+from unittest.mock import Mock
 
 import pytest
 
@@ -16,6 +18,7 @@ from mekara.cli import (
     _install_commands,
 )
 from mekara.scripting.resolution import ResolvedTarget, ScriptInfo
+from tests.utils import write_tree
 
 
 class TestCommandAffectsMekaraDir:
@@ -48,6 +51,12 @@ class TestCommandAffectsMekaraDir:
         script.write_text("# writes to .mekara/scripts/nl/foo.md")
         assert _command_affects_mekara_dir("random-name", script) is True
 
+    def test_non_utf8_content(self, tmp_path: Path) -> None:
+        """Content that is not valid UTF-8 should still be scanned for patterns."""
+        script = tmp_path / "test.md"
+        script.write_bytes(b"\xff\xfe writes to .CLAUDE/commands/")
+        assert _command_affects_mekara_dir("random-name", script) is True
+
     def test_no_match(self, tmp_path: Path) -> None:
         """Commands without relevant patterns should not affect .claude/."""
         script = tmp_path / "test.py"
@@ -61,507 +70,448 @@ class TestCommandAffectsMekaraDir:
         assert _command_affects_mekara_dir("finish", missing) is False
 
 
+class HookEnv:
+    """Drives a hook function with a fake stdin payload and a stubbed script resolution."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._monkeypatch = monkeypatch
+        self.resolve = Mock(return_value=None)
+        monkeypatch.setattr("mekara.scripting.resolution.resolve_target", self.resolve)
+        monkeypatch.setattr("mekara.scripting.loading.resolve_target", self.resolve)
+
+    def set_stdin(self, payload: dict[str, Any] | str) -> None:
+        """Feed a JSON payload (or raw text) to the hook's stdin."""
+        text = payload if isinstance(payload, str) else json.dumps(payload)
+        self._monkeypatch.setattr("sys.stdin", io.StringIO(text))
+
+    def set_target(self, target: ResolvedTarget | None) -> None:
+        """Make every script resolution return target."""
+        self.resolve.return_value = target
+
+
+@pytest.fixture
+def hook_env(monkeypatch: pytest.MonkeyPatch) -> HookEnv:
+    return HookEnv(monkeypatch)
+
+
+def _compiled_target(tmp_path: Path, stem: str, name: str, nl_content: str) -> ResolvedTarget:
+    compiled_path = tmp_path / f"{stem}.py"
+    compiled_path.write_text("# compiled script")
+    nl_path = tmp_path / f"{stem}.md"
+    nl_path.write_text(nl_content)
+    return ResolvedTarget(
+        compiled=ScriptInfo(path=compiled_path, is_bundled=False),
+        nl=ScriptInfo(path=nl_path, is_bundled=False),
+        name=name,
+    )
+
+
+def _nl_target(
+    tmp_path: Path, stem: str, name: str, content: str, *, bundled: bool
+) -> ResolvedTarget:
+    nl_path = tmp_path / f"{stem}.md"
+    nl_path.write_text(content)
+    return ResolvedTarget(
+        compiled=None,
+        nl=ScriptInfo(path=nl_path, is_bundled=bundled),
+        name=name,
+    )
+
+
 class TestHookUserPromptSubmit:
     """Tests for _hook_user_prompt_submit function."""
 
-    def test_non_slash_command_returns_zero(self) -> None:
+    def test_non_slash_command_returns_zero(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Non-slash commands should return 0 with no output."""
-        with (
-            patch("sys.stdin.read", return_value=json.dumps({"prompt": "hello world"})),
-            patch("builtins.print") as mock_print,
-        ):
-            result = _hook_user_prompt_submit()
-            assert result == 0
-            mock_print.assert_not_called()
-
-    def test_empty_prompt_returns_zero(self) -> None:
+        hook_env.set_stdin({"prompt": "hello world"})
+        assert _hook_user_prompt_submit() == 0
+        assert capsys.readouterr().out == ""
+
+    def test_empty_prompt_returns_zero(self, hook_env: HookEnv) -> None:
         """Empty prompt should return 0."""
-        with patch("sys.stdin.read", return_value=json.dumps({"prompt": ""})):
-            result = _hook_user_prompt_submit()
-            assert result == 0
+        hook_env.set_stdin({"prompt": ""})
+        assert _hook_user_prompt_submit() == 0
 
-    def test_invalid_json_returns_zero(self) -> None:
+    def test_invalid_json_returns_zero(self, hook_env: HookEnv) -> None:
         """Invalid JSON should return 0."""
-        with patch("sys.stdin.read", return_value="not json"):
-            result = _hook_user_prompt_submit()
-            assert result == 0
+        hook_env.set_stdin("not json")
+        assert _hook_user_prompt_submit() == 0
 
-    def test_unresolved_command_returns_zero(self) -> None:
+    def test_unresolved_command_returns_zero(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Unresolved commands should return 0."""
-        with (
-            patch("sys.stdin.read", return_value=json.dumps({"prompt": "/nonexistent-command"})),
-            patch("mekara.scripting.resolution.resolve_target", return_value=None),
-            patch("builtins.print") as mock_print,
-        ):
-            result = _hook_user_prompt_submit()
-            assert result == 0
-            mock_print.assert_not_called()
-
-    def test_compiled_script_outputs_mcp_instructions(self, tmp_path: Path) -> None:
+        hook_env.set_stdin({"prompt": "/nonexistent-command"})
+        assert _hook_user_prompt_submit() == 0
+        assert capsys.readouterr().out == ""
+
+    def test_compiled_script_outputs_mcp_instructions(
+        self, tmp_path: Path, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Compiled scripts should output MCP instructions."""
-        compiled_path = tmp_path / "test.py"
-        compiled_path.write_text("# test script")
-        nl_path = tmp_path / "test.md"
-        nl_path.write_text("# test NL source")
-
-        target = ResolvedTarget(
-            compiled=ScriptInfo(path=compiled_path, is_bundled=False),
-            nl=ScriptInfo(path=nl_path, is_bundled=False),
-            name="test-script",
-        )
+        hook_env.set_target(_compiled_target(tmp_path, "test", "test-script", "# NL source"))
+        hook_env.set_stdin({"prompt": "/test-script arg1 arg2"})
 
-        with (
-            patch("sys.stdin.read", return_value=json.dumps({"prompt": "/test-script arg1 arg2"})),
-            patch("mekara.scripting.resolution.resolve_target", return_value=target),
-            patch("mekara.utils.project.find_project_root", return_value=tmp_path),
-            patch("builtins.print") as mock_print,
-        ):
-            result = _hook_user_prompt_submit()
-            assert result == 0
-            mock_print.assert_called_once()
-            output = mock_print.call_args[0][0]
-            assert "MEKARA SCRIPT DETECTED" in output
-            assert "test-script" in output
-            assert "arg1 arg2" in output
-
-    def test_natural_language_command_no_mcp_output(self, tmp_path: Path) -> None:
-        """Natural language commands should not output MCP instructions."""
-        nl_path = tmp_path / "test.md"
-        nl_path.write_text("# test command")
+        assert _hook_user_prompt_submit() == 0
+        output = capsys.readouterr().out
+        assert "MEKARA SCRIPT DETECTED" in output
+        assert "test-script" in output
+        assert "arg1 arg2" in output
 
-        target = ResolvedTarget(
-            compiled=None,
-            nl=ScriptInfo(path=nl_path, is_bundled=False),
-            name="test-command",
+    def test_natural_language_command_no_mcp_output(
+        self, tmp_path: Path, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Natural language commands should not output MCP instructions."""
+        hook_env.set_target(
+            _nl_target(tmp_path, "test", "test-command", "# test command", bundled=False)
         )
+        hook_env.set_stdin({"prompt": "/test-command"})
 
-        with (
-            patch("sys.stdin.read", return_value=json.dumps({"prompt": "/test-command"})),
-            patch("mekara.scripting.resolution.resolve_target", return_value=target),
-            patch("mekara.utils.project.find_project_root", return_value=tmp_path),
-            patch("builtins.print") as mock_print,
-        ):
-            result = _hook_user_prompt_submit()
-            assert result == 0
-            # No MCP instructions for NL commands
-            mock_print.assert_not_called()
+        assert _hook_user_prompt_submit() == 0
+        # No MCP instructions for NL commands
+        assert capsys.readouterr().out == ""
 
     def test_dev_mode_outputs_for_mekara_affecting_commands(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        hook_env: HookEnv,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Dev mode should output system prompt for commands affecting .mekara/scripts/nl/."""
         monkeypatch.setenv("MEKARA_DEV", "true")
-
         # NL source with .mekara in content (used for dev mode check)
-        compiled_path = tmp_path / "my-script.py"
-        compiled_path.write_text("# compiled script")
-        nl_path = tmp_path / "my-script.md"
-        nl_path.write_text("# modifies .mekara/scripts/nl/")
-
-        target = ResolvedTarget(
-            compiled=ScriptInfo(path=compiled_path, is_bundled=False),
-            nl=ScriptInfo(path=nl_path, is_bundled=False),
-            name="my-script",
+        hook_env.set_target(
+            _compiled_target(tmp_path, "my-script", "my-script", "# modifies .mekara/scripts/nl/")
         )
+        hook_env.set_stdin({"prompt": "/my-script"})
 
-        with (
-            patch("sys.stdin.read", return_value=json.dumps({"prompt": "/my-script"})),
-            patch("mekara.scripting.resolution.resolve_target", return_value=target),
-            patch("mekara.utils.project.find_project_root", return_value=tmp_path),
-            patch("builtins.print") as mock_print,
-        ):
-            result = _hook_user_prompt_submit()
-            assert result == 0
-            # Should have 2 calls: dev-mode and MCP instructions
-            assert mock_print.call_count == 2
-            dev_output = mock_print.call_args_list[0][0][0]
-            assert "<dev-mode>" in dev_output
-            assert "DEV MODE ACTIVE" in dev_output
+        assert _hook_user_prompt_submit() == 0
+        # Dev-mode prompt first, then MCP instructions
+        output = capsys.readouterr().out
+        assert output.startswith("<dev-mode>")
+        assert "DEV MODE ACTIVE" in output
+        assert "MEKARA SCRIPT DETECTED" in output
 
     def test_dev_mode_no_output_for_non_mekara_commands(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        hook_env: HookEnv,
+        capsys: pytest.CaptureFixture[str],
     ) -> None:
         """Dev mode should NOT output for commands not affecting .mekara/scripts/nl/."""
         monkeypatch.setenv("MEKARA_DEV", "true")
-
         # Script without .mekara/scripts/nl patterns
-        compiled_path = tmp_path / "finish.py"
-        compiled_path.write_text("# compiled")
-        nl_path = tmp_path / "finish.md"
-        nl_path.write_text("# just finishes work")
-
-        target = ResolvedTarget(
-            compiled=ScriptInfo(path=compiled_path, is_bundled=False),
-            nl=ScriptInfo(path=nl_path, is_bundled=False),
-            name="finish",
-        )
+        hook_env.set_target(_compiled_target(tmp_path, "finish", "finish", "# just finishes work"))
+        hook_env.set_stdin({"prompt": "/finish"})
+
+        assert _hook_user_prompt_submit() == 0
+        # Only MCP instructions, no dev-mode
+        output = capsys.readouterr().out
+        assert "<dev-mode>" not in output
+        assert "MEKARA SCRIPT DETECTED" in output
+
+    def test_no_dev_mode_skips_content_scan(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, hook_env: HookEnv
+    ) -> None:
+        """Outside dev mode the script file should not be read for .mekara patterns."""
+        monkeypatch.delenv("MEKARA_DEV", raising=False)
+        affects = Mock()
+        monkeypatch.setattr("mekara.cli._command_affects_mekara_dir", affects)
+        hook_env.set_target(_compiled_target(tmp_path, "my-script", "my-script", "# NL source"))
+        hook_env.set_stdin({"prompt": "/my-script"})
+
+        assert _hook_user_prompt_submit() == 0
+        affects.assert_not_called()
 
-        with (
-            patch("sys.stdin.read", return_value=json.dumps({"prompt": "/finish"})),
-            patch("mekara.scripting.resolution.resolve_target", return_value=target),
-            patch("mekara.utils.project.find_project_root", return_value=tmp_path),
-            patch("builtins.print") as mock_print,
-        ):
-            result = _hook_user_prompt_submit()
-            assert result == 0
-            # Only MCP instructions, no dev-mode
-            assert mock_print.call_count == 1
-            output = mock_print.call_args[0][0]
-            assert "<dev-mode>" not in output
-            assert "MEKARA SCRIPT DETECTED" in output
-
-    def test_colon_separator_normalized(self, tmp_path: Path) -> None:
+    def test_colon_separator_normalized(self, tmp_path: Path, hook_env: HookEnv) -> None:
         """Colons in command names should be normalized to slashes."""
-        compiled_path = tmp_path / "nested.py"
-        compiled_path.write_text("# nested script")
-        nl_path = tmp_path / "nested.md"
-        nl_path.write_text("# NL source")
-
-        target = ResolvedTarget(
-            compiled=ScriptInfo(path=compiled_path, is_bundled=False),
-            nl=ScriptInfo(path=nl_path, is_bundled=False),
-            name="test:nested",  # Canonical name uses colons
-        )
+        # Canonical name uses colons
+        hook_env.set_target(_compiled_target(tmp_path, "nested", "test:nested", "# NL source"))
+        hook_env.set_stdin({"prompt": "/test:nested"})
 
-        with (
-            patch("sys.stdin.read", return_value=json.dumps({"prompt": "/test:nested"})),
-            patch(
-                "mekara.scripting.resolution.resolve_target", return_value=target
-            ) as mock_resolve,
-            patch("mekara.utils.project.find_project_root", return_value=tmp_path),
-            patch("builtins.print"),
-        ):
-            _hook_user_prompt_submit()
-            # Verify resolve was called with normalized name
-            mock_resolve.assert_called_once()
-            call_args = mock_resolve.call_args[0]
-            assert call_args[0] == "test/nested"
-
-    def test_double_slash_treated_as_single_slash(self, tmp_path: Path) -> None:
-        """Double-slash (//command) should be treated identically to single-slash."""
-        compiled_path = tmp_path / "test.py"
-        compiled_path.write_text("# test script")
-        nl_path = tmp_path / "test.md"
-        nl_path.write_text("# NL source")
-
-        target = ResolvedTarget(
-            compiled=ScriptInfo(path=compiled_path, is_bundled=False),
-            nl=ScriptInfo(path=nl_path, is_bundled=False),
-            name="test-script",
-        )
+        _hook_user_prompt_submit()
+        # Verify resolve was called with normalized name
+        hook_env.resolve.assert_called_once()
+        assert hook_env.resolve.call_args[0][0] == "test/nested"
 
+    def test_double_slash_treated_as_single_slash(
+        self, tmp_path: Path, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Double-slash (//command) should be treated identically to single-slash."""
+        hook_env.set_target(_compiled_target(tmp_path, "test", "test-script", "# NL source"))
         # Test //test-script resolves same as /test-script
-        with (
-            patch("sys.stdin.read", return_value=json.dumps({"prompt": "//test-script arg1"})),
-            patch(
-                "mekara.scripting.resolution.resolve_target", return_value=target
-            ) as mock_resolve,
-            patch("mekara.utils.project.find_project_root", return_value=tmp_path),
-            patch("builtins.print") as mock_print,
-        ):
-            result = _hook_user_prompt_submit()
-            assert result == 0
-            # Verify resolve was called with normalized name (no leading slash)
-            mock_resolve.assert_called_once()
-            call_args = mock_resolve.call_args[0]
-            assert call_args[0] == "test-script"
-            # Should output MCP instructions
-            mock_print.assert_called_once()
-            output = mock_print.call_args[0][0]
-            assert "MEKARA SCRIPT DETECTED" in output
-            assert "arg1" in output
-
-    def test_bundled_natural_language_outputs_content(self, tmp_path: Path) -> None:
+        hook_env.set_stdin({"prompt": "//test-script arg1"})
+
+        assert _hook_user_prompt_submit() == 0
+        # Verify resolve was called with normalized name (no leading slash)
+        hook_env.resolve.assert_called_once()
+        assert hook_env.resolve.call_args[0][0] == "test-script"
+        # Should output MCP instructions
+        output = capsys.readouterr().out
+        assert "MEKARA SCRIPT DETECTED" in output
+        assert "arg1" in output
+
+    def test_bundled_natural_language_outputs_content(
+        self, tmp_path: Path, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Bundled natural-language commands should output their content."""
-        nl_path = tmp_path / "bundled-cmd.md"
-        nl_path.write_text("# Bundled Command\n\nDo something with $ARGUMENTS here.\n\nMore text.")
-
-        target = ResolvedTarget(
-            compiled=None,  # NL-only
-            nl=ScriptInfo(path=nl_path, is_bundled=True),  # Bundled
-            name="bundled-cmd",
+        hook_env.set_target(
+            _nl_target(
+                tmp_path,
+                "bundled-cmd",
+                "bundled-cmd",
+                "# Bundled Command\n\nDo something with $ARGUMENTS here.\n\nMore text.",
+                bundled=True,
+            )
         )
+        hook_env.set_stdin({"prompt": "/bundled-cmd my-arg"})
 
-        with (
-            patch("sys.stdin.read", return_value=json.dumps({"prompt": "/bundled-cmd my-arg"})),
-            patch("mekara.scripting.resolution.resolve_target", return_value=target),
-            patch("mekara.scripting.loading.resolve_target", return_value=target),
-            patch("mekara.utils.project.find_project_root", return_value=tmp_path),
-            patch("builtins.print") as mock_print,
-        ):
-            result = _hook_user_prompt_submit()
-            assert result == 0
-            # Should have 2 print calls: command-name tag and content
-            assert mock_print.call_count == 2
-            # First call: command-name tag
-            name_output = mock_print.call_args_list[0][0][0]
-            assert "<command-name>/bundled-cmd</command-name>" in name_output
-            # Second call: content with $ARGUMENTS replaced
-            content_output = mock_print.call_args_list[1][0][0]
-            assert "Do something with my-arg here." in content_output
-            assert "$ARGUMENTS" not in content_output
-
-    def test_bundled_command_replaces_only_first_arguments(self, tmp_path: Path) -> None:
-        """$ARGUMENTS should only be replaced once (first occurrence)."""
-        nl_path = tmp_path / "multi-args.md"
-        nl_path.write_text("First: $ARGUMENTS\nSecond: $ARGUMENTS")
+        assert _hook_user_prompt_submit() == 0
+        # Command-name tag first, then content with $ARGUMENTS replaced
+        name_output, content_output = capsys.readouterr().out.split("\n", 1)
+        assert name_output == "<command-name>/bundled-cmd</command-name>"
+        assert "Do something with my-arg here." in content_output
+        assert "$ARGUMENTS" not in content_output
 
-        target = ResolvedTarget(
-            compiled=None,
-            nl=ScriptInfo(path=nl_path, is_bundled=True),
-            name="multi-args",
+    def test_bundled_command_replaces_only_first_arguments(
+        self, tmp_path: Path, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """$ARGUMENTS should only be replaced once (first occurrence)."""
+        hook_env.set_target(
+            _nl_target(
+                tmp_path,
+                "multi-args",
+                "multi-args",
+                "First: $ARGUMENTS\nSecond: $ARGUMENTS",
+                bundled=True,
+            )
         )
+        hook_env.set_stdin({"prompt": "/multi-args replaced"})
 
-        with (
-            patch("sys.stdin.read", return_value=json.dumps({"prompt": "/multi-args replaced"})),
-            patch("mekara.scripting.resolution.resolve_target", return_value=target),
-            patch("mekara.scripting.loading.resolve_target", return_value=target),
-            patch("mekara.utils.project.find_project_root", return_value=tmp_path),
-            patch("builtins.print") as mock_print,
-        ):
-            _hook_user_prompt_submit()
-            content_output = mock_print.call_args_list[1][0][0]
-            # First occurrence replaced, second kept
-            assert "First: replaced" in content_output
-            assert "Second: $ARGUMENTS" in content_output
+        _hook_user_prompt_submit()
+        content_output = capsys.readouterr().out
+        # First occurrence replaced, second kept
+        assert "First: replaced" in content_output
+        assert "Second: $ARGUMENTS" in content_output
 
 
 class TestHookPreToolUse:
     """Tests for _hook_pre_tool_use function."""
 
-    def test_non_skill_tool_returns_zero(self) -> None:
+    def test_non_skill_tool_returns_zero(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Non-Skill tools should return 0 with no output."""
-        input_data = {"tool_name": "Bash", "tool_input": {"command": "ls"}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("builtins.print") as mock_print:
-                result = _hook_pre_tool_use()
-                assert result == 0
-                mock_print.assert_not_called()
-
-    def test_empty_skill_name_returns_zero(self) -> None:
+        hook_env.set_stdin({"tool_name": "Bash", "tool_input": {"command": "ls"}})
+        assert _hook_pre_tool_use() == 0
+        assert capsys.readouterr().out == ""
+
+    def test_empty_skill_name_returns_zero(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Empty skill name should return 0."""
-        input_data = {"tool_name": "Skill", "tool_input": {"skill": ""}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("builtins.print") as mock_print:
-                result = _hook_pre_tool_use()
-                assert result == 0
-                mock_print.assert_not_called()
-
-    def test_invalid_json_returns_zero(self) -> None:
+        hook_env.set_stdin({"tool_name": "Skill", "tool_input": {"skill": ""}})
+        assert _hook_pre_tool_use() == 0
+        assert capsys.readouterr().out == ""
+
+    def test_invalid_json_returns_zero(self, hook_env: HookEnv) -> None:
         """Invalid JSON should return 0."""
-        with patch("sys.stdin.read", return_value="not json"):
-            result = _hook_pre_tool_use()
-            assert result == 0
+        hook_env.set_stdin("not json")
+        assert _hook_pre_tool_use() == 0
 
-    def test_unresolved_skill_returns_zero(self) -> None:
+    def test_unresolved_skill_returns_zero(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Unresolved skills should return 0 (let Skill tool proceed)."""
-        input_data = {"tool_name": "Skill", "tool_input": {"skill": "nonexistent"}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("mekara.scripting.resolution.resolve_target", return_value=None):
-                with patch("builtins.print") as mock_print:
-                    result = _hook_pre_tool_use()
-                    assert result == 0
-                    mock_print.assert_not_called()
-
-    def test_natural_language_skill_returns_zero(self, tmp_path: Path) -> None:
-        """Natural language commands should return 0 (let Skill tool proceed)."""
-        nl_path = tmp_path / "test.md"
-        nl_path.write_text("# test command")
+        hook_env.set_stdin({"tool_name": "Skill", "tool_input": {"skill": "nonexistent"}})
+        assert _hook_pre_tool_use() == 0
+        assert capsys.readouterr().out == ""
 
-        target = ResolvedTarget(
-            compiled=None,
-            nl=ScriptInfo(path=nl_path, is_bundled=False),
-            name="test-command",
+    def test_natural_language_skill_returns_zero(
+        self, tmp_path: Path, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Natural language commands should return 0 (let Skill tool proceed)."""
+        hook_env.set_target(
+            _nl_target(tmp_path, "test", "test-command", "# test command", bundled=False)
         )
+        hook_env.set_stdin({"tool_name": "Skill", "tool_input": {"skill": "test-command"}})
 
-        input_data = {"tool_name": "Skill", "tool_input": {"skill": "test-command"}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("mekara.scripting.resolution.resolve_target", return_value=target):
-                with patch("mekara.utils.project.find_project_root", return_value=tmp_path):
-                    with patch("builtins.print") as mock_print:
-                        result = _hook_pre_tool_use()
-                        assert result == 0
-                        mock_print.assert_not_called()
+        assert _hook_pre_tool_use() == 0
+        assert capsys.readouterr().out == ""
 
-    def test_compiled_script_outputs_deny_decision(self, tmp_path: Path) -> None:
+    def test_compiled_script_outputs_deny_decision(
+        self, tmp_path: Path, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Compiled scripts should output deny decision with MCP redirect."""
-        compiled_path = tmp_path / "test.py"
-        compiled_path.write_text("# test script")
-        nl_path = tmp_path / "test.md"
-        nl_path.write_text("# NL source")
-
-        target = ResolvedTarget(
-            compiled=ScriptInfo(path=compiled_path, is_bundled=False),
-            nl=ScriptInfo(path=nl_path, is_bundled=False),
-            name="test-script",
+        hook_env.set_target(_compiled_target(tmp_path, "test", "test-script", "# NL source"))
+        hook_env.set_stdin(
+            {"tool_name": "Skill", "tool_input": {"skill": "test-script", "args": "arg1 arg2"}}
         )
 
-        input_data = {
-            "tool_name": "Skill",
-            "tool_input": {"skill": "test-script", "args": "arg1 arg2"},
-        }
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("mekara.scripting.resolution.resolve_target", return_value=target):
-                with patch("mekara.utils.project.find_project_root", return_value=tmp_path):
-                    with patch("builtins.print") as mock_print:
-                        result = _hook_pre_tool_use()
-                        assert result == 0
-                        mock_print.assert_called_once()
-                        output = json.loads(mock_print.call_args[0][0])
-                        assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
-                        reason = output["hookSpecificOutput"]["permissionDecisionReason"]
-                        assert "test-script" in reason
-                        assert "mcp__mekara__start" in reason
-                        assert "arg1 arg2" in reason
-
-    def test_colon_separator_normalized(self, tmp_path: Path) -> None:
+        assert _hook_pre_tool_use() == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["hookSpecificOutput"]["permissionDecision"] == "deny"
+        reason = output["hookSpecificOutput"]["permissionDecisionReason"]
+        assert "test-script" in reason
+        assert "mcp__mekara__start" in reason
+        assert "arg1 arg2" in reason
+
+    def test_skill_name_slash_and_colon_normalized(
+        self, tmp_path: Path, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """A leading slash is stripped and colons become slashes before resolution."""
+        hook_env.set_target(_compiled_target(tmp_path, "nested", "test/nested", "# NL source"))
+        hook_env.set_stdin({"tool_name": "Skill", "tool_input": {"skill": "/test:nested"}})
+
+        assert _hook_pre_tool_use() == 0
+        hook_env.resolve.assert_called_once_with("test/nested")
+        reason = json.loads(capsys.readouterr().out)["hookSpecificOutput"][
+            "permissionDecisionReason"
+        ]
+        assert 'mcp__mekara__start with name="test/nested"' in reason
+
+    def test_colon_separator_normalized(self, tmp_path: Path, hook_env: HookEnv) -> None:
         """Colons in skill names should be normalized to slashes."""
-        compiled_path = tmp_path / "nested.py"
-        compiled_path.write_text("# nested script")
-        nl_path = tmp_path / "nested.md"
-        nl_path.write_text("# NL source")
-
-        target = ResolvedTarget(
-            compiled=ScriptInfo(path=compiled_path, is_bundled=False),
-            nl=ScriptInfo(path=nl_path, is_bundled=False),
-            name="test:nested",  # Canonical name uses colons
-        )
+        # Canonical name uses colons
+        hook_env.set_target(_compiled_target(tmp_path, "nested", "test:nested", "# NL source"))
+        hook_env.set_stdin({"tool_name": "Skill", "tool_input": {"skill": "test:nested"}})
 
-        input_data = {"tool_name": "Skill", "tool_input": {"skill": "test:nested"}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch(
-                "mekara.scripting.resolution.resolve_target", return_value=target
-            ) as mock_resolve:
-                with patch("mekara.utils.project.find_project_root", return_value=tmp_path):
-                    with patch("builtins.print"):
-                        _hook_pre_tool_use()
-                        # Verify resolve was called with normalized name
-                        mock_resolve.assert_called_once()
-                        call_args = mock_resolve.call_args[0]
-                        assert call_args[0] == "test/nested"
+        _hook_pre_tool_use()
+        # Verify resolve was called with normalized name
+        hook_env.resolve.assert_called_once()
+        assert hook_env.resolve.call_args[0][0] == "test/nested"
 
 
 class TestHookAutoApprove:
     """Tests for _hook_auto_approve function."""
 
-    def test_auto_approve_non_bash_tool(self) -> None:
+    def test_auto_approve_non_bash_tool(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Non-Bash tools should be auto-approved."""
-        input_data = {"tool_name": "Read", "tool_input": {"file_path": "/tmp/test.txt"}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("builtins.print") as mock_print:
-                result = _hook_auto_approve()
-                assert result == 0
-                mock_print.assert_called_once()
-                output = json.loads(mock_print.call_args[0][0])
-                assert output["hookSpecificOutput"]["hookEventName"] == "PreToolUse"
-                assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
-
-    def test_auto_approve_safe_bash_command(self) -> None:
+        hook_env.set_stdin({"tool_name": "Read", "tool_input": {"file_path": "/tmp/test.txt"}})
+        assert _hook_auto_approve() == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["hookSpecificOutput"]["hookEventName"] == "PreToolUse"
+        assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
+
+    def test_auto_approve_safe_bash_command(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Safe Bash commands should be auto-approved."""
-        input_data = {"tool_name": "Bash", "tool_input": {"command": "ls -la"}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("builtins.print") as mock_print:
-                result = _hook_auto_approve()
-                assert result == 0
-                mock_print.assert_called_once()
-                output = json.loads(mock_print.call_args[0][0])
-                assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
-
-    def test_no_auto_approve_rm_command(self) -> None:
+        hook_env.set_stdin({"tool_name": "Bash", "tool_input": {"command": "ls -la"}})
+        assert _hook_auto_approve() == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
+
+    def test_no_auto_approve_rm_command(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Bash commands starting with 'rm ' should not be auto-approved."""
-        input_data = {"tool_name": "Bash", "tool_input": {"command": "rm -rf /tmp/test"}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("builtins.print") as mock_print:
-                result = _hook_auto_approve()
-                assert result == 0
-                # Should return empty output (no auto-approve)
-                mock_print.assert_not_called()
-
-    def test_no_auto_approve_git_commit_command(self) -> None:
+        hook_env.set_stdin({"tool_name": "Bash", "tool_input": {"command": "rm -rf /tmp/test"}})
+        assert _hook_auto_approve() == 0
+        # Should return empty output (no auto-approve)
+        assert capsys.readouterr().out == ""
+
+    def test_no_auto_approve_git_commit_command(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Bash commands starting with 'git commit' should not be auto-approved."""
-        input_data = {
-            "tool_name": "Bash",
-            "tool_input": {"command": 'git commit -m "test message"'},
-        }
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("builtins.print") as mock_print:
-                result = _hook_auto_approve()
-                assert result == 0
-                # Should return empty output (no auto-approve)
-                mock_print.assert_not_called()
-
-    def test_no_auto_approve_rm_with_leading_whitespace(self) -> None:
+        hook_env.set_stdin(
+            {"tool_name": "Bash", "tool_input": {"command": 'git commit -m "test message"'}}
+        )
+        assert _hook_auto_approve() == 0
+        # Should return empty output (no auto-approve)
+        assert capsys.readouterr().out == ""
+
+    def test_no_auto_approve_rm_with_leading_whitespace(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """rm commands with leading whitespace should not be auto-approved."""
-        input_data = {"tool_name": "Bash", "tool_input": {"command": "  rm file.txt"}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("builtins.print") as mock_print:
-                result = _hook_auto_approve()
-                assert result == 0
-                mock_print.assert_not_called()
-
-    def test_auto_approve_rmdir_command(self) -> None:
+        hook_env.set_stdin({"tool_name": "Bash", "tool_input": {"command": "  rm file.txt"}})
+        assert _hook_auto_approve() == 0
+        assert capsys.readouterr().out == ""
+
+    def test_auto_approve_rmdir_command(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Commands starting with 'rmdir' should be auto-approved (not 'rm ')."""
-        input_data = {"tool_name": "Bash", "tool_input": {"command": "rmdir /tmp/test"}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("builtins.print") as mock_print:
-                result = _hook_auto_approve()
-                assert result == 0
-                mock_print.assert_called_once()
-                output = json.loads(mock_print.call_args[0][0])
-                assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
-
-    def test_auto_approve_git_non_commit_command(self) -> None:
+        hook_env.set_stdin({"tool_name": "Bash", "tool_input": {"command": "rmdir /tmp/test"}})
+        assert _hook_auto_approve() == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
+
+    def test_auto_approve_git_non_commit_command(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """git commands other than commit should be auto-approved."""
-        input_data = {"tool_name": "Bash", "tool_input": {"command": "git status"}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("builtins.print") as mock_print:
-                result = _hook_auto_approve()
-                assert result == 0
-                mock_print.assert_called_once()
-                output = json.loads(mock_print.call_args[0][0])
-                assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
-
-    def test_invalid_json_returns_zero(self) -> None:
+        hook_env.set_stdin({"tool_name": "Bash", "tool_input": {"command": "git status"}})
+        assert _hook_auto_approve() == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
+
+    def test_invalid_json_returns_zero(self, hook_env: HookEnv) -> None:
         """Invalid JSON should return 0."""
-        with patch("sys.stdin.read", return_value="not json"):
-            result = _hook_auto_approve()
-            assert result == 0
+        hook_env.set_stdin("not json")
+        assert _hook_auto_approve() == 0
 
-    def test_empty_tool_name_auto_approved(self) -> None:
+    def test_empty_tool_name_auto_approved(
+        self, hook_env: HookEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Empty tool name should be auto-approved."""
-        input_data = {"tool_name": "", "tool_input": {}}
-        with patch("sys.stdin.read", return_value=json.dumps(input_data)):
-            with patch("builtins.print") as mock_print:
-                result = _hook_auto_approve()
-                assert result == 0
-                mock_print.assert_called_once()
-                output = json.loads(mock_print.call_args[0][0])
-                assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
+        hook_env.set_stdin({"tool_name": "", "tool_input": {}})
+        assert _hook_auto_approve() == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["hookSpecificOutput"]["permissionDecision"] == "allow"
+
+
+class InstallEnv:
+    """Fake bundled commands directory and home directory for _install_commands."""
+
+    def __init__(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.bundled_dir = tmp_path / "bundled"
+        self.bundled_dir.mkdir()
+        self.home = tmp_path / "home"
+        self.home.mkdir()
+        self.mekara_dir = self.home / ".mekara" / "scripts" / "nl"
+        self.claude_dir = self.home / ".claude" / "commands"
+        monkeypatch.setattr(
+            "mekara.utils.project.bundled_commands_dir", Mock(return_value=self.bundled_dir)
+        )
+        monkeypatch.setattr("pathlib.Path.home", Mock(return_value=self.home))
+
+    def bundle(self, files: dict[str, str]) -> None:
+        """Write files (relative path -> content) into the bundled commands directory."""
+        write_tree(self.bundled_dir, files)
+
+    def preinstall(self, files: dict[str, str], *, claude_symlink: bool = False) -> None:
+        """Pre-create ~/.mekara/scripts/nl with files, optionally linking ~/.claude/commands."""
+        write_tree(self.mekara_dir, files)
+        if claude_symlink:
+            self.claude_dir.parent.mkdir(parents=True)
+            self.claude_dir.symlink_to(self.mekara_dir)
+
+
+@pytest.fixture
+def install_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> InstallEnv:
+    return InstallEnv(tmp_path, monkeypatch)
 
 
 class TestInstallCommands:
     """Tests for _install_commands function."""
 
-    def test_installs_commands_when_neither_dir_exists(self, tmp_path: Path) -> None:
+    def test_installs_commands_when_neither_dir_exists(self, install_env: InstallEnv) -> None:
         """When neither dir exists, creates mekara as canonical and symlinks claude to it."""
-        # Set up fake bundled commands directory
-        bundled_dir = tmp_path / "bundled"
-        bundled_dir.mkdir()
-        (bundled_dir / "command1.md").write_text("# Command 1")
-        (bundled_dir / "command2.md").write_text("# Command 2")
+        install_env.bundle({"command1.md": "# Command 1", "command2.md": "# Command 2"})
 
-        # Use tmp_path as fake home
-        fake_home = tmp_path / "home"
-        fake_home.mkdir()
+        assert _install_commands() == 0
 
-        with patch("mekara.utils.project.bundled_commands_dir", return_value=bundled_dir):
-            with patch("pathlib.Path.home", return_value=fake_home):
-                result = _install_commands()
-
-        assert result == 0
-
-        mekara_dir = fake_home / ".mekara" / "scripts" / "nl"
-        claude_dir = fake_home / ".claude" / "commands"
+        mekara_dir = install_env.mekara_dir
+        claude_dir = install_env.claude_dir
 
         # Mekara dir should be a real directory with commands
         assert mekara_dir.is_dir()
@@ -576,26 +526,17 @@ class TestInstallCommands:
         # Commands should be accessible via both paths
         assert (claude_dir / "command1.md").read_text() == "# Command 1"
 
-    def test_installs_commands_when_claude_exists(self, tmp_path: Path) -> None:
+    def test_installs_commands_when_claude_exists(self, install_env: InstallEnv) -> None:
         """When claude dir exists, mekara should symlink to it."""
-        bundled_dir = tmp_path / "bundled"
-        bundled_dir.mkdir()
-        (bundled_dir / "command1.md").write_text("# Command 1")
-
-        fake_home = tmp_path / "home"
-        fake_home.mkdir()
+        install_env.bundle({"command1.md": "# Command 1"})
 
         # Pre-create ~/.claude/commands/ as a real directory
-        claude_dir = fake_home / ".claude" / "commands"
+        claude_dir = install_env.claude_dir
         claude_dir.mkdir(parents=True)
 
-        with patch("mekara.utils.project.bundled_commands_dir", return_value=bundled_dir):
-            with patch("pathlib.Path.home", return_value=fake_home):
-                result = _install_commands()
+        assert _install_commands() == 0
 
-        assert result == 0
-
-        mekara_dir = fake_home / ".mekara" / "scripts" / "nl"
+        mekara_dir = install_env.mekara_dir
 
         # Claude dir should remain a real directory
         assert claude_dir.is_dir()
@@ -609,107 +550,61 @@ class TestInstallCommands:
         assert (claude_dir / "command1.md").exists()
         assert (claude_dir / "command1.md").read_text() == "# Command 1"
 
-    def test_preserves_directory_structure(self, tmp_path: Path) -> None:
+    def test_preserves_directory_structure(self, install_env: InstallEnv) -> None:
         """Should preserve subdirectory structure when installing."""
-        bundled_dir = tmp_path / "bundled"
-        bundled_dir.mkdir()
-        (bundled_dir / "project").mkdir()
-        (bundled_dir / "top.md").write_text("# Top")
-        (bundled_dir / "project" / "nested.md").write_text("# Nested")
-
-        fake_home = tmp_path / "home"
-        fake_home.mkdir()
-
-        with patch("mekara.utils.project.bundled_commands_dir", return_value=bundled_dir):
-            with patch("pathlib.Path.home", return_value=fake_home):
-                result = _install_commands()
+        install_env.bundle({"top.md": "# Top", "project/nested.md": "# Nested"})
 
-        assert result == 0
+        assert _install_commands() == 0
 
-        mekara_dir = fake_home / ".mekara" / "scripts" / "nl"
-        assert (mekara_dir / "top.md").exists()
-        assert (mekara_dir / "project" / "nested.md").exists()
+        assert (install_env.mekara_dir / "top.md").exists()
+        assert (install_env.mekara_dir / "project" / "nested.md").exists()
 
-    def test_skips_up_to_date_files(self, tmp_path: Path) -> None:
+    def test_skips_up_to_date_files(
+        self, install_env: InstallEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Should skip files that already have the same content."""
-        bundled_dir = tmp_path / "bundled"
-        bundled_dir.mkdir()
-        (bundled_dir / "same.md").write_text("# Same content")
-        (bundled_dir / "new.md").write_text("# New content")
-
-        fake_home = tmp_path / "home"
-        fake_home.mkdir()
+        install_env.bundle({"same.md": "# Same content", "new.md": "# New content"})
 
         # Pre-create mekara dir with existing file
-        mekara_dir = fake_home / ".mekara" / "scripts" / "nl"
-        mekara_dir.mkdir(parents=True)
-        (mekara_dir / "same.md").write_text("# Same content")
+        install_env.preinstall({"same.md": "# Same content"})
 
-        with patch("mekara.utils.project.bundled_commands_dir", return_value=bundled_dir):
-            with patch("pathlib.Path.home", return_value=fake_home):
-                with patch("builtins.print") as mock_print:
-                    result = _install_commands()
+        assert _install_commands() == 0
+        output = capsys.readouterr().out
+        assert "Installed 1 commands" in output
+        assert "1 already up to date" in output
 
-        assert result == 0
-        calls = [str(call) for call in mock_print.call_args_list]
-        assert any("Installed 1 commands" in call for call in calls)
-        assert any("1 already up to date" in call for call in calls)
-
-    def test_updates_changed_files(self, tmp_path: Path) -> None:
+    def test_updates_changed_files(self, install_env: InstallEnv) -> None:
         """Should update files that have different content."""
-        bundled_dir = tmp_path / "bundled"
-        bundled_dir.mkdir()
-        (bundled_dir / "changed.md").write_text("# New version")
-
-        fake_home = tmp_path / "home"
-        fake_home.mkdir()
-
-        mekara_dir = fake_home / ".mekara" / "scripts" / "nl"
-        mekara_dir.mkdir(parents=True)
-        (mekara_dir / "changed.md").write_text("# Old version")
+        install_env.bundle({"changed.md": "# New version"})
+        install_env.preinstall({"changed.md": "# Old version"})
 
-        with patch("mekara.utils.project.bundled_commands_dir", return_value=bundled_dir):
-            with patch("pathlib.Path.home", return_value=fake_home):
-                result = _install_commands()
+        assert _install_commands() == 0
+        assert (install_env.mekara_dir / "changed.md").read_text() == "# New version"
 
-        assert result == 0
-        assert (mekara_dir / "changed.md").read_text() == "# New version"
-
-    def test_returns_error_if_bundled_dir_missing(self, tmp_path: Path) -> None:
+    def test_returns_error_if_bundled_dir_missing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, install_env: InstallEnv
+    ) -> None:
         """Should return error if bundled commands directory doesn't exist."""
-        missing_dir = tmp_path / "nonexistent"
-
-        with patch("mekara.utils.project.bundled_commands_dir", return_value=missing_dir):
-            result = _install_commands()
+        monkeypatch.setattr(
+            "mekara.utils.project.bundled_commands_dir",
+            Mock(return_value=tmp_path / "nonexistent"),
+        )
 
-        assert result == 1
+        assert _install_commands() == 1
 
-    def test_does_not_recreate_existing_symlink(self, tmp_path: Path) -> None:
+    def test_does_not_recreate_existing_symlink(
+        self, install_env: InstallEnv, capsys: pytest.CaptureFixture[str]
+    ) -> None:
         """Should not recreate symlink if it already exists and works."""
-        bundled_dir = tmp_path / "bundled"
-        bundled_dir.mkdir()
-        (bundled_dir / "command.md").write_text("# Command")
-
-        fake_home = tmp_path / "home"
-        fake_home.mkdir()
+        install_env.bundle({"command.md": "# Command"})
 
         # Pre-create the standard setup: mekara as canonical, claude as symlink
-        mekara_dir = fake_home / ".mekara" / "scripts" / "nl"
-        mekara_dir.mkdir(parents=True)
-        claude_dir = fake_home / ".claude" / "commands"
-        claude_dir.parent.mkdir(parents=True)
-        claude_dir.symlink_to(mekara_dir)
+        install_env.preinstall({}, claude_symlink=True)
 
-        with patch("mekara.utils.project.bundled_commands_dir", return_value=bundled_dir):
-            with patch("pathlib.Path.home", return_value=fake_home):
-                with patch("builtins.print") as mock_print:
-                    result = _install_commands()
-
-        assert result == 0
+        assert _install_commands() == 0
 
         # Should not print symlink creation message
-        calls = [str(call) for call in mock_print.call_args_list]
-        assert not any("Created symlink" in call for call in calls)
+        assert "Created symlink" not in capsys.readouterr().out
 
         # Symlink should still be there
-        assert claude_dir.is_symlink()
+        assert install_env.claude_dir.is_symlink()
@@ -20,7 +20,9 @@ from mekara.mcp.executor import (
 )
 from mekara.mcp.server import MekaraServer
 from mekara.scripting.auto import AutoExecutionError, AutoExecutionResult, AutoExecutor
+from mekara.scripting.resolution import ResolvedTarget
 from mekara.scripting.runtime import Auto, CallScript, Llm, auto, call_script, llm
+from mekara.utils.project import bundled_commands_dir, bundled_scripts_dir, bundled_standards_dir
 from tests.utils import ScriptLoaderStub
 
 
@@ -43,23 +45,29 @@ def script_with_auto_only(_request: str) -> Generator[Auto | Llm | CallScript, A
     yield auto("echo hello", context="Greet")
 
 
+@pytest.fixture
+def nested_scripts(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    """Stub a parent script plus the children the push_script tests nest under it."""
+    ScriptLoaderStub(
+        monkeypatch,
+        tmp_path,
+        {
+            "parent": script_with_llm_step,
+            "child": script_with_auto_only,
+            "child_with_llm": script_with_two_llm_steps,
+        },
+    ).apply()
+
+
 class TestMcpScriptExecutorPushScript:
     """Tests for push_script functionality in McpScriptExecutor."""
 
     @pytest.mark.asyncio
     async def test_push_script_adds_to_stack(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, nested_scripts: None, auto_executor: AutoExecutor
     ) -> None:
         """push_script should add a new frame to the stack."""
-        ScriptLoaderStub(
-            monkeypatch,
-            tmp_path,
-            {
-                "parent": script_with_llm_step,
-                "child": script_with_auto_only,
-            },
-        ).apply()
-        executor = McpScriptExecutor(tmp_path, AutoExecutor())
+        executor = McpScriptExecutor(tmp_path, auto_executor)
         executor.push_script("parent", "", tmp_path)
 
         # Initial state: stack has one frame
@@ -81,18 +89,10 @@ class TestMcpScriptExecutorPushScript:
 
     @pytest.mark.asyncio
     async def test_push_script_runs_nested_then_returns_to_parent_llm(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, nested_scripts: None, auto_executor: AutoExecutor
     ) -> None:
         """After nested script completes, parent's llm step should still be pending."""
-        ScriptLoaderStub(
-            monkeypatch,
-            tmp_path,
-            {
-                "parent": script_with_llm_step,
-                "child": script_with_auto_only,
-            },
-        ).apply()
-        executor = McpScriptExecutor(tmp_path, AutoExecutor())
+        executor = McpScriptExecutor(tmp_path, auto_executor)
         executor.push_script("parent", "", tmp_path)
 
         # Run until we hit the parent's llm step
@@ -116,18 +116,10 @@ class TestMcpScriptExecutorPushScript:
 
     @pytest.mark.asyncio
     async def test_push_script_with_nested_llm_step(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, nested_scripts: None, auto_executor: AutoExecutor
     ) -> None:
         """Nested script with its own llm step should pause there first."""
-        ScriptLoaderStub(
-            monkeypatch,
-            tmp_path,
-            {
-                "parent": script_with_llm_step,
-                "child": script_with_two_llm_steps,
-            },
-        ).apply()
-        executor = McpScriptExecutor(tmp_path, AutoExecutor())
+        executor = McpScriptExecutor(tmp_path, auto_executor)
         executor.push_script("parent", "", tmp_path)
 
         # Run until we hit the parent's llm step
@@ -136,7 +128,7 @@ class TestMcpScriptExecutorPushScript:
         assert result1.pending.step.prompt == "Please do something"
 
         # Push a nested script that has its own llm step
-        executor.push_script("child", "", tmp_path)
+        executor.push_script("child_with_llm", "", tmp_path)
 
         # Run - should stop at child's first llm step
         result2 = await executor.run_until_llm()
@@ -167,19 +159,16 @@ class TestMekaraServerNestedStart:
     """Tests for nested script invocation via MekaraServer.start."""
 
     @pytest.mark.asyncio
-    async def test_start_while_script_running_pushes_to_stack(self, tmp_path: Path) -> None:
+    async def test_start_while_script_running_pushes_to_stack(
+        self, tmp_path: Path, random_target: ResolvedTarget, auto_executor: AutoExecutor
+    ) -> None:
         """Calling start while a script is running should push onto stack, not replace."""
-        from mekara.scripting.resolution import resolve_target
-
-        target = resolve_target("test/random")
-        assert target is not None, "test/random script not found"
-
         # Create server with a custom executor for the first script
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
         # Manually set up an executor in a pending llm state
-        server.executor = McpScriptExecutor(tmp_path, AutoExecutor())
-        server.executor.push_script(target.name, "", tmp_path)
+        server.executor = McpScriptExecutor(tmp_path, auto_executor)
+        server.executor.push_script(random_target.name, "", tmp_path)
 
         # Run until llm step
         result1 = await server.executor.run_until_llm()
@@ -210,14 +199,9 @@ class TestMekaraServerNestedStart:
 
     @pytest.mark.asyncio
     async def test_nested_start_preserves_parent_state(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, auto_executor: AutoExecutor
     ) -> None:
         """Parent script state should be preserved when nested script is pushed."""
-        from mekara.scripting.resolution import resolve_target
-
-        target = resolve_target("test/random")
-        assert target is not None
-
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
         # Start first script manually to control state
@@ -228,7 +212,7 @@ class TestMekaraServerNestedStart:
                 "parent_script": script_with_llm_step,
             },
         ).apply()
-        server.executor = McpScriptExecutor(tmp_path, AutoExecutor())
+        server.executor = McpScriptExecutor(tmp_path, auto_executor)
         server.executor.push_script("parent_script", "", tmp_path)
 
         # Run until llm step
@@ -285,7 +269,7 @@ class TestNestedScriptFailureHaltsParent:
 
     @pytest.mark.asyncio
     async def test_call_script_to_missing_script_halts_parent(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, auto_executor: AutoExecutor
     ) -> None:
         """call_script to a missing script should halt the parent with PendingLlmStep."""
         ScriptLoaderStub(
@@ -297,7 +281,7 @@ class TestNestedScriptFailureHaltsParent:
             },
         ).apply()
 
-        executor = McpScriptExecutor(tmp_path, AutoExecutor())
+        executor = McpScriptExecutor(tmp_path, auto_executor)
         executor.push_script("parent", "", tmp_path)
 
         result = await executor.run_until_llm()
@@ -352,9 +336,6 @@ class TestWriteBundled:
 
     def test_write_bundled_command_happy_path(self, tmp_path: Path) -> None:
         """write_bundled should copy bundled NL source to local .mekara/scripts/."""
-        from mekara.mcp.server import MekaraServer
-        from mekara.utils.project import bundled_commands_dir
-
         # Create the MekaraServer
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
@@ -375,9 +356,6 @@ class TestWriteBundled:
 
     def test_write_bundled_command_with_compiled(self, tmp_path: Path) -> None:
         """write_bundled should also copy compiled .py if it exists."""
-        from mekara.mcp.server import MekaraServer
-        from mekara.utils.project import bundled_scripts_dir
-
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
         # Use "finish" which has a compiled version
@@ -398,8 +376,6 @@ class TestWriteBundled:
 
     def test_write_bundled_command_not_found(self, tmp_path: Path) -> None:
         """write_bundled should error if name matches neither a command nor a standard."""
-        from mekara.mcp.server import MekaraServer
-
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
         response = server.write_bundled("nonexistent_command")
@@ -410,8 +386,6 @@ class TestWriteBundled:
 
     def test_write_bundled_command_already_exists_without_force(self, tmp_path: Path) -> None:
         """write_bundled should error if local file exists without force=True."""
-        from mekara.mcp.server import MekaraServer
-
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
         # First write: should succeed
@@ -426,8 +400,6 @@ class TestWriteBundled:
 
     def test_write_bundled_command_force_overwrite(self, tmp_path: Path) -> None:
         """write_bundled should overwrite local file with force=True."""
-        from mekara.mcp.server import MekaraServer
-
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
         # First write
@@ -448,14 +420,10 @@ class TestWriteBundled:
 
     def test_write_bundled_command_with_nested_path(self, tmp_path: Path) -> None:
         """write_bundled should handle nested command paths with colons."""
-        from mekara.mcp.server import MekaraServer
-
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
         # Use a nested command (project:release or similar)
         # First verify it exists
-        from mekara.utils.project import bundled_commands_dir
-
         bundled = bundled_commands_dir()
         # Look for any nested script
         nested_scripts = list(bundled.glob("*/"))
@@ -480,9 +448,6 @@ class TestWriteBundled:
 
     def test_write_bundled_standard_with_prefix(self, tmp_path: Path) -> None:
         """write_bundled should write a standard when given 'standard:' prefix."""
-        from mekara.mcp.server import MekaraServer
-        from mekara.utils.project import bundled_standards_dir
-
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
         response = server.write_bundled("standard:command")
@@ -498,8 +463,6 @@ class TestWriteBundled:
 
     def test_write_bundled_standard_auto_detect(self, tmp_path: Path) -> None:
         """write_bundled should auto-detect a standard when name matches only standards."""
-        from mekara.mcp.server import MekaraServer
-
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
         # "workflow" exists as a standard but not as a command
@@ -511,8 +474,6 @@ class TestWriteBundled:
 
     def test_write_bundled_standard_not_found(self, tmp_path: Path) -> None:
         """write_bundled should error with explicit standard: prefix for missing standard."""
-        from mekara.mcp.server import MekaraServer
-
         server = MekaraServer(fs_access=RealFilesystemAccess(), working_dir=tmp_path)
 
         response = server.write_bundled("standard:nonexistent")
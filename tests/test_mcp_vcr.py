@@ -7,46 +7,111 @@ This enables hermetic testing of MCP server behavior.
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Callable, Generator
 from pathlib import Path
+from typing import Any
 
 import pytest
 import yaml
 
-from mekara.scripting.auto import AutoExecutor
-from mekara.utils.project import find_project_root
+from mekara.mcp import server
+from mekara.mcp.executor import McpScriptExecutor
+from mekara.scripting.auto import AutoExecutionResult, AutoExecutor
+from mekara.scripting.resolution import ResolvedTarget
+from mekara.scripting.runtime import Auto, CallScript, Llm, ShellResult, auto
 from mekara.vcr import VcrAutoExecutor
-from mekara.vcr.cassette import VCRCassette
+from mekara.vcr.cassette import SafeLoader, VCRCassette
+from mekara.vcr.config import MEKARA_VCR_CASSETTE_ENV
+from mekara.vcr.events import McpStatusInputEvent, McpToolOutputEvent
+from mekara.vcr.mcp_server import VcrMekaraServer
 from tests.utils import ScriptLoaderStub
 from tests.vcr_test_driver import MekaraServerTestDriver
 
-# Get project root for script resolution
-_base_dir = find_project_root()
+
+class FakeAutoExecutor(AutoExecutor):
+    """Auto executor that returns a fixed shell result without spawning a process."""
+
+    async def execute(self, step: Auto, *, working_dir: Path) -> AsyncIterator[AutoExecutionResult]:
+        yield AutoExecutionResult(result=ShellResult(success=True, exit_code=0, output="42\n"))
+
+
+def _create_marker(path: str) -> None:
+    """Create the marker file in-process, without spawning a shell."""
+    Path(path).touch()
+
+
+def script_that_creates_file(request: str) -> Generator[Auto | Llm | CallScript, Any, Any]:
+    """Script whose only auto step creates the marker file named by the request."""
+    yield auto(_create_marker, {"path": request}, context="Create marker file")
+
+
+def script_that_touches_file(request: str) -> Generator[Auto | Llm | CallScript, Any, Any]:
+    """Script whose only auto step shells out to touch the marker file named by the request."""
+    yield auto(f"touch {request}", context="Create marker file")
+
+
+@pytest.fixture(scope="session")
+async def recorded_random_cassette(
+    tmp_path_factory: pytest.TempPathFactory, random_target: ResolvedTarget
+) -> tuple[Path, str]:
+    """Record test/random once per session; return the cassette path and the recorded output."""
+    working_dir = tmp_path_factory.mktemp("random-record")
+    cassette_path = working_dir / "cassette.yaml"
+    cassette = VCRCassette(
+        cassette_path, mode="record", initial_state={"working_dir": str(working_dir)}
+    )
+    executor = McpScriptExecutor(
+        working_dir, VcrAutoExecutor(cassette=cassette, inner=FakeAutoExecutor())
+    )
+    executor.push_script(random_target.name, "", working_dir)
+
+    result = await executor.run_until_llm()
+    cassette.save()
+    return cassette_path, result.output_text
+
+
+class StatusThenExitFastMCP:
+    """FastMCP stand-in whose run() polls status() once, then exits.
+
+    run() raises exit_error when set, simulating a crash or Ctrl-C, and returns otherwise.
+    """
+
+    exit_error: type[BaseException] | None = None
+
+    def __init__(self, name: str) -> None:
+        self._tools: dict[str, Callable[..., Any]] = {}
+
+    def tool(self) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        return self._register
+
+    def _register(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        self._tools[fn.__name__] = fn
+        return fn
+
+    def run(self, transport: str) -> None:
+        self._tools["status"]()
+        if self.exit_error is not None:
+            raise self.exit_error
 
 
 class TestMcpVcrIntegration:
     """Integration tests for MCP server with VCR cassettes."""
 
     @pytest.mark.asyncio
-    async def test_record_and_replay_produces_identical_output(self, tmp_path: Path) -> None:
+    async def test_record_and_replay_produces_identical_output(
+        self, tmp_path: Path, random_target: ResolvedTarget
+    ) -> None:
         """Recording and replaying a script produces identical MCP tool outputs."""
-        from mekara.mcp import server
-        from mekara.mcp.executor import McpScriptExecutor
-        from mekara.scripting.resolution import resolve_target
-
         cassette_path = tmp_path / "cassette.yaml"
 
         # Phase 1: Record
         record_cassette = VCRCassette(
             cassette_path, mode="record", initial_state={"working_dir": str(tmp_path)}
         )
-        real_executor = AutoExecutor()
-        vcr_executor = VcrAutoExecutor(cassette=record_cassette, inner=real_executor)
-
-        target = resolve_target("test/random")
-        assert target is not None, "test/random script not found"
+        vcr_executor = VcrAutoExecutor(cassette=record_cassette, inner=FakeAutoExecutor())
 
         executor = McpScriptExecutor(tmp_path, vcr_executor)
-        executor.push_script(target.name, "", tmp_path)
+        executor.push_script(random_target.name, "", tmp_path)
 
         # Run until llm step
         result1 = await executor.run_until_llm()
@@ -61,7 +126,7 @@ class TestMcpVcrIntegration:
 
         # Reload script and create new executor
         executor2 = McpScriptExecutor(tmp_path, vcr_executor2)
-        executor2.push_script(target.name, "", tmp_path)
+        executor2.push_script(random_target.name, "", tmp_path)
 
         # Run until llm step (should use recorded auto step results)
         result2 = await executor2.run_until_llm()
@@ -75,34 +140,35 @@ class TestMcpVcrIntegration:
         )
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "script",
+        [script_that_touches_file, script_that_creates_file],
+        ids=["shell", "python-call"],
+    )
     async def test_replay_does_not_execute_commands(
-        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        auto_executor: AutoExecutor,
+        script: Callable[[str], Generator[Auto | Llm | CallScript, Any, Any]],
     ) -> None:
-        """VCR replay should NOT execute shell commands - use recorded results."""
-        from mekara.mcp.executor import McpScriptExecutor
-        from mekara.scripting.runtime import auto
-
+        """VCR replay should NOT execute auto steps (shell or Python) - use recorded results."""
         cassette_path = tmp_path / "cassette.yaml"
         marker_file = tmp_path / "marker.txt"
 
-        # Create a script that would create a marker file
-        def script_that_creates_file(_request: str):
-            yield auto(f"touch {marker_file}", context="Create marker file")
-
         ScriptLoaderStub(
             monkeypatch,
             tmp_path,
-            {"test_script": script_that_creates_file},
+            {"test_script": script},
         ).apply()
 
-        # Phase 1: Record (actually execute the command)
+        # Phase 1: Record (actually execute the step)
         record_cassette = VCRCassette(
             cassette_path, mode="record", initial_state={"working_dir": str(tmp_path)}
         )
-        real_executor = AutoExecutor()
-        vcr_executor = VcrAutoExecutor(cassette=record_cassette, inner=real_executor)
+        vcr_executor = VcrAutoExecutor(cassette=record_cassette, inner=auto_executor)
         executor = McpScriptExecutor(tmp_path, vcr_executor)
-        executor.push_script("test_script", "", tmp_path)
+        executor.push_script("test_script", str(marker_file), tmp_path)
 
         await executor.run_until_llm()
         record_cassette.save()
@@ -114,91 +180,68 @@ class TestMcpVcrIntegration:
         marker_file.unlink()
         assert not marker_file.exists()
 
-        # Phase 2: Replay (should NOT execute command)
+        # Phase 2: Replay (should NOT execute the step)
         replay_cassette = VCRCassette(cassette_path, mode="replay")
         vcr_executor2 = VcrAutoExecutor(cassette=replay_cassette)
         executor2 = McpScriptExecutor(tmp_path, vcr_executor2)
-        executor2.push_script("test_script", "", tmp_path)
+        executor2.push_script("test_script", str(marker_file), tmp_path)
 
         await executor2.run_until_llm()
 
-        # Marker file should NOT exist - command was not executed
+        # Marker file should NOT exist - the step was not executed
         assert not marker_file.exists(), (
             "Marker file was created during VCR replay! "
-            "Shell commands should NOT be executed during replay."
+            "Auto steps should NOT be executed during replay."
         )
 
     @pytest.mark.asyncio
-    async def test_replay_uses_recorded_random_output(self, tmp_path: Path) -> None:
+    @pytest.mark.parametrize("iteration", [1, 2, 3])
+    async def test_replay_uses_recorded_random_output(
+        self,
+        iteration: int,
+        recorded_random_cassette: tuple[Path, str],
+        random_target: ResolvedTarget,
+    ) -> None:
         """VCR replay should return the recorded output, not new random values."""
-        from mekara.mcp.executor import McpScriptExecutor
-        from mekara.scripting.resolution import resolve_target
-
-        cassette_path = tmp_path / "cassette.yaml"
-
-        # Phase 1: Record
-        record_cassette = VCRCassette(
-            cassette_path, mode="record", initial_state={"working_dir": str(tmp_path)}
-        )
-        real_executor = AutoExecutor()
-        vcr_executor = VcrAutoExecutor(cassette=record_cassette, inner=real_executor)
-
-        target = resolve_target("test/random")
-        assert target is not None
-
-        executor = McpScriptExecutor(tmp_path, vcr_executor)
-        executor.push_script(target.name, "", tmp_path)
-
-        result1 = await executor.run_until_llm()
-        record_cassette.save()
-
-        # Extract the random number from the output
-        output1 = result1.output_text
+        cassette_path, recorded_output = recorded_random_cassette
+        working_dir = cassette_path.parent
 
-        # Phase 2: Replay multiple times - should always get same output
-        for i in range(3):
-            replay_cassette = VCRCassette(cassette_path, mode="replay")
-            vcr_executor2 = VcrAutoExecutor(cassette=replay_cassette)
-            executor2 = McpScriptExecutor(tmp_path, vcr_executor2)
-            executor2.push_script(target.name, "", tmp_path)
+        replay_cassette = VCRCassette(cassette_path, mode="replay")
+        vcr_executor = VcrAutoExecutor(cassette=replay_cassette)
+        executor = McpScriptExecutor(working_dir, vcr_executor)
+        executor.push_script(random_target.name, "", working_dir)
 
-            result2 = await executor2.run_until_llm()
-            output2 = result2.output_text
+        result = await executor.run_until_llm()
 
-            assert output1 == output2, (
-                f"Replay {i + 1} produced different random output:\n"
-                f"Expected: {output1}\n"
-                f"Got: {output2}"
-            )
+        assert result.output_text == recorded_output, (
+            f"Replay {iteration} produced different random output:\n"
+            f"Expected: {recorded_output}\n"
+            f"Got: {result.output_text}"
+        )
 
 
 class TestMcpVcrCassetteFormat:
     """Tests for the VCR cassette format used by MCP server."""
 
     @pytest.mark.asyncio
-    async def test_cassette_contains_auto_step_events(self, tmp_path: Path) -> None:
+    async def test_cassette_contains_auto_step_events(
+        self, tmp_path: Path, random_target: ResolvedTarget
+    ) -> None:
         """Recording should create cassette with auto_step events."""
-        from mekara.mcp.executor import McpScriptExecutor
-        from mekara.scripting.resolution import resolve_target
-
         cassette_path = tmp_path / "cassette.yaml"
         cassette = VCRCassette(
             cassette_path, mode="record", initial_state={"working_dir": str(tmp_path)}
         )
-        real_executor = AutoExecutor()
-        vcr_executor = VcrAutoExecutor(cassette=cassette, inner=real_executor)
-
-        target = resolve_target("test/random")
-        assert target is not None
+        vcr_executor = VcrAutoExecutor(cassette=cassette, inner=FakeAutoExecutor())
 
         executor = McpScriptExecutor(tmp_path, vcr_executor)
-        executor.push_script(target.name, "", tmp_path)
+        executor.push_script(random_target.name, "", tmp_path)
 
         await executor.run_until_llm()
         cassette.save()
 
         # Load cassette and verify structure
-        data = yaml.safe_load(cassette_path.read_text())
+        data = yaml.load(cassette_path.read_bytes(), Loader=SafeLoader)
         assert "events" in data
         assert len(data["events"]) > 0
 
@@ -243,8 +286,6 @@ class TestMcpSessionReplay:
         Replay uses MekaraServerTestDriver which consumes mcp_tool_input events
         and calls VcrMekaraServer, which verifies outputs match.
         """
-        from mekara.vcr.mcp_server import VcrMekaraServer
-
         cassette_path = tmp_path / "session.yaml"
 
         # Phase 1: Record
@@ -262,3 +303,108 @@ class TestMcpSessionReplay:
         await driver.run()
 
         # If we get here without exception, replay verified outputs matched
+
+    @pytest.mark.asyncio
+    async def test_replay_output_mismatch_reports_diff(self, tmp_path: Path) -> None:
+        """A replayed tool output that differs from the recording raises with a diff."""
+        cassette_path = tmp_path / "session.yaml"
+        record_cassette = VCRCassette(
+            cassette_path, mode="record", initial_state={"working_dir": str(tmp_path)}
+        )
+        record_cassette.record_event(McpStatusInputEvent())
+        record_cassette.record_event(
+            McpToolOutputEvent(tool="status", output="Script test/random is running.")
+        )
+        record_cassette.save()
+
+        replay_cassette = VCRCassette(cassette_path, mode="replay")
+        with pytest.raises(ValueError, match=r"status\(\) output mismatch") as exc_info:
+            await MekaraServerTestDriver(replay_cassette).run()
+
+        message = str(exc_info.value)
+        assert "Expected: 'Script test/random is running.'" in message
+        assert "Got: 'No script is currently running.'" in message
+        assert "--- recorded\n+++ replayed\n" in message
+        assert "-Script test/random is running.\n+No script is currently running." in message
+
+    @pytest.mark.asyncio
+    async def test_replay_output_mismatch_truncates_long_values(self, tmp_path: Path) -> None:
+        """Long mismatched outputs are cut to 512 characters in Expected; the diff keeps them."""
+        recorded = "stale line\n" * 100
+        cassette_path = tmp_path / "session.yaml"
+        record_cassette = VCRCassette(
+            cassette_path, mode="record", initial_state={"working_dir": str(tmp_path)}
+        )
+        record_cassette.record_event(McpStatusInputEvent())
+        record_cassette.record_event(McpToolOutputEvent(tool="status", output=recorded))
+        record_cassette.save()
+
+        replay_cassette = VCRCassette(cassette_path, mode="replay")
+        with pytest.raises(ValueError) as exc_info:
+            await MekaraServerTestDriver(replay_cassette).run()
+
+        message = str(exc_info.value)
+        assert f"Expected: {recorded[:512]!r}...\n" in message
+        assert repr(recorded) not in message
+        assert message.count("-stale line\n") == 100
+
+
+class TestMcpVcrDeferredSave:
+    """status() defers its save to the next tool call or to server shutdown."""
+
+    def test_status_alone_does_not_write(self, tmp_path: Path) -> None:
+        """Recording a status() call leaves the cassette unwritten."""
+        cassette_path = tmp_path / "session.yaml"
+        cassette = VCRCassette(
+            cassette_path, mode="record", initial_state={"working_dir": str(tmp_path)}
+        )
+        VcrMekaraServer(cassette, working_dir=tmp_path).status()
+
+        assert not cassette_path.exists()
+
+    def test_next_tool_call_writes_status_events(self, tmp_path: Path) -> None:
+        """The next saving tool call persists the deferred status() events with its own."""
+        cassette_path = tmp_path / "session.yaml"
+        cassette = VCRCassette(
+            cassette_path, mode="record", initial_state={"working_dir": str(tmp_path)}
+        )
+        vcr_server = VcrMekaraServer(cassette, working_dir=tmp_path)
+        vcr_server.status()
+        vcr_server.write_bundled("nonexistent_command")
+
+        events = yaml.load(cassette_path.read_bytes(), Loader=SafeLoader)["events"]
+        tools = [(event["type"], event["tool"]) for event in events if "tool" in event]
+        assert tools[:2] == [("mcp_tool_input", "status"), ("mcp_tool_output", "status")]
+        assert tools[-2:] == [
+            ("mcp_tool_input", "write_bundled"),
+            ("mcp_tool_output", "write_bundled"),
+        ]
+
+    @pytest.mark.parametrize(
+        "exit_error", [None, KeyboardInterrupt, RuntimeError], ids=["clean", "interrupt", "crash"]
+    )
+    def test_shutdown_writes_status_events(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+        exit_error: type[BaseException] | None,
+    ) -> None:
+        """run_server saves deferred status() events however the server exits."""
+        cassette_path = tmp_path / "session.yaml"
+        (tmp_path / ".mekara").mkdir()
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv(MEKARA_VCR_CASSETTE_ENV, str(cassette_path))
+        monkeypatch.setattr(StatusThenExitFastMCP, "exit_error", exit_error)
+        monkeypatch.setattr(server, "FastMCP", StatusThenExitFastMCP)
+
+        if exit_error is None:
+            server.run_server()
+        else:
+            with pytest.raises(exit_error):
+                server.run_server()
+
+        events = yaml.load(cassette_path.read_bytes(), Loader=SafeLoader)["events"]
+        assert events == [
+            McpStatusInputEvent().to_dict(),
+            McpToolOutputEvent(tool="status", output="No script is currently running.").to_dict(),
+        ]
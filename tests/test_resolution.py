@@ -1,11 +1,11 @@
 """Tests for script and command resolution logic."""
 
-from contextlib import ExitStack
+from dataclasses import FrozenInstanceError
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
+from mekara.scripting import resolution
 from mekara.scripting.resolution import (
     ResolvedTarget,
     Script,
@@ -13,6 +13,7 @@ from mekara.scripting.resolution import (
     SearchLevel,
     resolve_target,
 )
+from tests.utils import write_tree
 
 
 class TestScriptInfo:
@@ -27,7 +28,7 @@ class TestScriptInfo:
     def test_frozen_immutability(self) -> None:
         """ScriptInfo should be immutable (frozen dataclass)."""
         info = ScriptInfo(path=Path("/some/path.py"), is_bundled=False)
-        with pytest.raises(AttributeError, match="cannot assign to field"):
+        with pytest.raises(FrozenInstanceError):
             setattr(info, "is_bundled", True)
 
 
@@ -94,33 +95,56 @@ class TestResolvedTarget:
         """ResolvedTarget should be immutable (frozen dataclass)."""
         nl = ScriptInfo(path=Path("/project/.mekara/scripts/nl/finish.md"), is_bundled=False)
         target = ResolvedTarget(compiled=None, nl=nl, name="finish")
-        with pytest.raises(AttributeError, match="cannot assign to field"):
+        with pytest.raises(FrozenInstanceError):
             setattr(target, "name", "other")
 
 
+class SearchLevelsEnv:
+    """Points resolve_target at test-owned search levels for the duration of a test."""
+
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self._monkeypatch = monkeypatch
+
+    def set(
+        self, *, nl: list[SearchLevel], compiled: list[SearchLevel], bundled_base: Path
+    ) -> None:
+        self._monkeypatch.setattr(resolution, "_NL_SCRIPT_LEVELS", nl)
+        self._monkeypatch.setattr(resolution, "_COMPILED_SCRIPT_LEVELS", compiled)
+        self._monkeypatch.setattr(resolution, "_BUNDLED_BASE", bundled_base)
+
+    def use_local(self, root: Path) -> None:
+        """Search only <root>/.mekara, with no bundled level."""
+        self.set(
+            nl=[SearchLevel(root / ".mekara" / "scripts" / "nl", ".md")],
+            compiled=[SearchLevel(root / ".mekara" / "scripts" / "compiled", ".py")],
+            bundled_base=root / "nonexistent",
+        )
+
+
+@pytest.fixture
+def search_levels(monkeypatch: pytest.MonkeyPatch) -> SearchLevelsEnv:
+    return SearchLevelsEnv(monkeypatch)
+
+
 class TestResolveTarget:
     """Tests for the resolve_target function."""
 
-    def test_returns_none_when_nothing_found(self, tmp_path: Path) -> None:
+    def test_returns_none_when_nothing_found(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Should return None when no matching NL source exists."""
         nl_levels = [SearchLevel(tmp_path / "nl", ".md")]
         compiled_levels = [SearchLevel(tmp_path / "compiled", ".py")]
-        with (
-            patch("mekara.scripting.resolution._NL_SCRIPT_LEVELS", nl_levels),
-            patch("mekara.scripting.resolution._COMPILED_SCRIPT_LEVELS", compiled_levels),
-            patch("mekara.scripting.resolution._BUNDLED_BASE", tmp_path / "bundled"),
-        ):
-            result = resolve_target("nonexistent")
+        search_levels.set(nl=nl_levels, compiled=compiled_levels, bundled_base=tmp_path / "bundled")
+        result = resolve_target("nonexistent")
         assert result is None
 
-    def test_returns_none_when_no_project_and_no_user_or_bundled(self, tmp_path: Path) -> None:
+    def test_returns_none_when_no_project_and_no_user_or_bundled(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Should return None when there are no levels or no matching scripts."""
-        with (
-            patch("mekara.scripting.resolution._NL_SCRIPT_LEVELS", []),
-            patch("mekara.scripting.resolution._COMPILED_SCRIPT_LEVELS", []),
-            patch("mekara.scripting.resolution._BUNDLED_BASE", tmp_path / "bundled"),
-        ):
-            result = resolve_target("anything")
+        search_levels.set(nl=[], compiled=[], bundled_base=tmp_path / "bundled")
+        result = resolve_target("anything")
         assert result is None
 
 
@@ -158,7 +182,7 @@ class TestNewPrecedenceAlgorithm:
             "bundled_base": tmp_path / "bundled",
         }
 
-    def _patch_levels(self, locs: dict[str, Path]) -> tuple:
+    def _use_levels(self, search_levels: SearchLevelsEnv, locs: dict[str, Path]) -> None:
         nl_levels = [
             SearchLevel(locs["local_commands"], ".md"),
             SearchLevel(locs["user_commands"], ".md"),
@@ -169,266 +193,182 @@ class TestNewPrecedenceAlgorithm:
             SearchLevel(locs["user_scripts"], ".py"),
             SearchLevel(locs["bundled_scripts"], ".py"),
         ]
-        return (
-            patch("mekara.scripting.resolution._NL_SCRIPT_LEVELS", nl_levels),
-            patch("mekara.scripting.resolution._COMPILED_SCRIPT_LEVELS", compiled_levels),
-            patch("mekara.scripting.resolution._BUNDLED_BASE", locs["bundled_base"]),
-        )
-
-    def test_local_nl_with_local_compiled(
-        self, project_with_all_locations: dict[str, Path]
+        search_levels.set(nl=nl_levels, compiled=compiled_levels, bundled_base=locs["bundled_base"])
+
+    @pytest.mark.parametrize(
+        ("files", "compiled_location", "nl_location"),
+        [
+            pytest.param(
+                ["local_scripts", "local_commands"],
+                "local_scripts",
+                "local_commands",
+                id="local-nl-with-local-compiled",
+            ),
+            pytest.param(
+                ["local_commands", "bundled_scripts"],
+                None,
+                "local_commands",
+                id="local-nl-ignores-bundled-compiled",
+            ),
+            pytest.param(
+                ["user_scripts", "bundled_commands"],
+                "user_scripts",
+                "bundled_commands",
+                id="bundled-nl-with-user-compiled",
+            ),
+            pytest.param(
+                ["user_commands", "bundled_scripts"],
+                None,
+                "user_commands",
+                id="user-nl-ignores-bundled-compiled",
+            ),
+            pytest.param(
+                ["bundled_commands"],
+                None,
+                "bundled_commands",
+                id="bundled-nl-only",
+            ),
+            pytest.param(
+                ["bundled_scripts", "bundled_commands"],
+                "bundled_scripts",
+                "bundled_commands",
+                id="bundled-nl-with-bundled-compiled",
+            ),
+        ],
+    )
+    def test_precedence(
+        self,
+        project_with_all_locations: dict[str, Path],
+        search_levels: SearchLevelsEnv,
+        files: list[str],
+        compiled_location: str | None,
+        nl_location: str,
     ) -> None:
-        """Local NL + local compiled should both be included."""
+        """NL wins at its highest level; compiled is used only at the same or a higher level."""
         locs = project_with_all_locations
+        for location in files:
+            suffix = ".py" if location.endswith("_scripts") else ".md"
+            (locs[location] / f"test{suffix}").write_text(f"# {location}")
 
-        (locs["local_scripts"] / "test.py").write_text("# local compiled")
-        (locs["local_commands"] / "test.md").write_text("local command")
-
-        with ExitStack() as stack:
-            for p in self._patch_levels(locs):
-                stack.enter_context(p)
-            result = resolve_target("test")
+        self._use_levels(search_levels, locs)
+        result = resolve_target("test")
 
         assert result is not None
-        assert result.target_type == Script.COMPILED
-        assert result.compiled is not None
-        assert result.compiled.path == locs["local_scripts"] / "test.py"
-        assert result.nl.path == locs["local_commands"] / "test.md"
-        assert result.is_bundled is False
-
-    def test_local_nl_ignores_bundled_compiled(
-        self, project_with_all_locations: dict[str, Path]
-    ) -> None:
-        """Local NL should NOT include bundled compiled (lower precedence)."""
-        locs = project_with_all_locations
-
-        (locs["local_commands"] / "test.md").write_text("local command")
-        (locs["bundled_scripts"] / "test.py").write_text("# bundled compiled")
-
-        with ExitStack() as stack:
-            for p in self._patch_levels(locs):
-                stack.enter_context(p)
-            result = resolve_target("test")
-
-        assert result is not None
-        assert result.target_type == Script.NATURAL_LANGUAGE
-        assert result.compiled is None
-        assert result.nl.path == locs["local_commands"] / "test.md"
-        assert result.is_bundled is False
-
-    def test_bundled_nl_with_user_compiled(
-        self, project_with_all_locations: dict[str, Path]
-    ) -> None:
-        """Bundled NL + user compiled should include both (user has higher precedence)."""
-        locs = project_with_all_locations
-
-        (locs["user_scripts"] / "test.py").write_text("# user compiled")
-        (locs["bundled_commands"] / "test.md").write_text("bundled command")
-
-        with ExitStack() as stack:
-            for p in self._patch_levels(locs):
-                stack.enter_context(p)
-            result = resolve_target("test")
-
-        assert result is not None
-        assert result.target_type == Script.COMPILED
-        assert result.compiled is not None
-        assert result.compiled.path == locs["user_scripts"] / "test.py"
-        assert result.compiled.is_bundled is False
-        assert result.nl.path == locs["bundled_commands"] / "test.md"
-        assert result.nl.is_bundled is True
-
-    def test_user_nl_ignores_bundled_compiled(
-        self, project_with_all_locations: dict[str, Path]
-    ) -> None:
-        """User NL should NOT include bundled compiled (lower precedence)."""
-        locs = project_with_all_locations
-
-        (locs["user_commands"] / "test.md").write_text("user command")
-        (locs["bundled_scripts"] / "test.py").write_text("# bundled compiled")
-
-        with ExitStack() as stack:
-            for p in self._patch_levels(locs):
-                stack.enter_context(p)
-            result = resolve_target("test")
-
-        assert result is not None
-        assert result.target_type == Script.NATURAL_LANGUAGE
-        assert result.compiled is None
-        assert result.nl.path == locs["user_commands"] / "test.md"
-
-    def test_bundled_nl_only(self, project_with_all_locations: dict[str, Path]) -> None:
-        """Bundled NL only should return NL-only target."""
-        locs = project_with_all_locations
-
-        (locs["bundled_commands"] / "test.md").write_text("bundled command")
-
-        with ExitStack() as stack:
-            for p in self._patch_levels(locs):
-                stack.enter_context(p)
-            result = resolve_target("test")
-
-        assert result is not None
-        assert result.target_type == Script.NATURAL_LANGUAGE
-        assert result.compiled is None
-        assert result.nl.path == locs["bundled_commands"] / "test.md"
-        assert result.is_bundled is True
-        assert result.is_nl is True
-
-    def test_bundled_nl_with_bundled_compiled(
-        self, project_with_all_locations: dict[str, Path]
-    ) -> None:
-        """Bundled NL + bundled compiled should include both."""
-        locs = project_with_all_locations
-
-        (locs["bundled_scripts"] / "test.py").write_text("# bundled compiled")
-        (locs["bundled_commands"] / "test.md").write_text("bundled command")
-
-        with ExitStack() as stack:
-            for p in self._patch_levels(locs):
-                stack.enter_context(p)
-            result = resolve_target("test")
-
-        assert result is not None
-        assert result.target_type == Script.COMPILED
-        assert result.compiled is not None
-        assert result.compiled.path == locs["bundled_scripts"] / "test.py"
-        assert result.compiled.is_bundled is True
-        assert result.nl.path == locs["bundled_commands"] / "test.md"
-        assert result.nl.is_bundled is True
+        assert result.nl.path == locs[nl_location] / "test.md"
+        assert result.nl.is_bundled is nl_location.startswith("bundled")
+        if compiled_location is None:
+            assert result.target_type == Script.NATURAL_LANGUAGE
+            assert result.compiled is None
+            assert result.is_nl is True
+            assert result.is_bundled is result.nl.is_bundled
+        else:
+            assert result.target_type == Script.COMPILED
+            assert result.compiled is not None
+            assert result.compiled.path == locs[compiled_location] / "test.py"
+            assert result.compiled.is_bundled is compiled_location.startswith("bundled")
+            assert result.is_bundled is result.compiled.is_bundled
 
 
 class TestHyphenUnderscoreHandling:
     """Tests for hyphen/underscore conversion in script names."""
 
-    def _patch_local(self, tmp_path: Path) -> tuple:
-        nl_levels = [SearchLevel(tmp_path / ".mekara" / "scripts" / "nl", ".md")]
-        compiled_levels = [SearchLevel(tmp_path / ".mekara" / "scripts" / "compiled", ".py")]
-        return (
-            patch("mekara.scripting.resolution._NL_SCRIPT_LEVELS", nl_levels),
-            patch("mekara.scripting.resolution._COMPILED_SCRIPT_LEVELS", compiled_levels),
-            patch("mekara.scripting.resolution._BUNDLED_BASE", tmp_path / "nonexistent"),
-        )
-
-    def test_exact_match_preferred_for_compiled(self, tmp_path: Path) -> None:
+    def test_exact_match_preferred_for_compiled(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Exact hyphen match should be preferred if it exists."""
-        scripts_path = tmp_path / ".mekara" / "scripts" / "compiled"
-        commands_path = tmp_path / ".mekara" / "scripts" / "nl"
-        scripts_path.mkdir(parents=True)
-        commands_path.mkdir(parents=True)
-
-        (scripts_path / "merge-main.py").write_text("# hyphen version")
-        (scripts_path / "merge_main.py").write_text("# underscore version")
-        (commands_path / "merge-main.md").write_text("NL source")
+        write_tree(
+            tmp_path / ".mekara" / "scripts",
+            {
+                "compiled/merge-main.py": "# hyphen version",
+                "compiled/merge_main.py": "# underscore version",
+                "nl/merge-main.md": "NL source",
+            },
+        )
 
-        with ExitStack() as stack:
-            for p in self._patch_local(tmp_path):
-                stack.enter_context(p)
-            result = resolve_target("merge-main")
+        search_levels.use_local(tmp_path)
+        result = resolve_target("merge-main")
 
         assert result is not None
         assert result.name == "merge-main"
         assert result.compiled is not None
         assert result.compiled.path.name == "merge-main.py"
 
-    def test_underscore_fallback_for_compiled(self, tmp_path: Path) -> None:
+    def test_underscore_fallback_for_compiled(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Should fall back to underscore version for compiled scripts."""
-        scripts_path = tmp_path / ".mekara" / "scripts" / "compiled"
-        commands_path = tmp_path / ".mekara" / "scripts" / "nl"
-        scripts_path.mkdir(parents=True)
-        commands_path.mkdir(parents=True)
-
-        (scripts_path / "merge_main.py").write_text("# underscore version")
-        (commands_path / "merge_main.md").write_text("NL source")
+        write_tree(
+            tmp_path / ".mekara" / "scripts",
+            {"compiled/merge_main.py": "# underscore version", "nl/merge_main.md": "NL source"},
+        )
 
-        with ExitStack() as stack:
-            for p in self._patch_local(tmp_path):
-                stack.enter_context(p)
-            result = resolve_target("merge-main")
+        search_levels.use_local(tmp_path)
+        result = resolve_target("merge-main")
 
         assert result is not None
         assert result.compiled is not None
         assert result.compiled.path.name == "merge_main.py"
 
-    def test_underscore_fallback_for_natural_language(self, tmp_path: Path) -> None:
+    def test_underscore_fallback_for_natural_language(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Should fall back to underscore version for natural-language commands."""
-        commands_path = tmp_path / ".mekara" / "scripts" / "nl"
-        commands_path.mkdir(parents=True)
-
-        (commands_path / "my_command.md").write_text("# command")
+        write_tree(tmp_path / ".mekara" / "scripts", {"nl/my_command.md": "# command"})
 
-        with ExitStack() as stack:
-            for p in self._patch_local(tmp_path):
-                stack.enter_context(p)
-            result = resolve_target("my-command")
+        search_levels.use_local(tmp_path)
+        result = resolve_target("my-command")
 
         assert result is not None
         assert result.target_type == Script.NATURAL_LANGUAGE
         assert result.nl.path.name == "my_command.md"
 
-    def test_hyphenated_directory_converted_to_underscored(self, tmp_path: Path) -> None:
+    def test_hyphenated_directory_converted_to_underscored(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Hyphenated directory names should be converted to underscored for compiled scripts."""
-        scripts_path = tmp_path / ".mekara" / "scripts" / "compiled"
-        commands_path = tmp_path / ".mekara" / "scripts" / "nl"
-
-        nl_dir = commands_path / "ai-tooling"
-        nl_dir.mkdir(parents=True)
-        (nl_dir / "setup-mekara-mcp.md").write_text("# NL source")
-
-        compiled_dir = scripts_path / "ai_tooling"
-        compiled_dir.mkdir(parents=True)
-        (compiled_dir / "setup_mekara_mcp.py").write_text("# compiled")
+        write_tree(
+            tmp_path / ".mekara" / "scripts",
+            {
+                "nl/ai-tooling/setup-mekara-mcp.md": "# NL source",
+                "compiled/ai_tooling/setup_mekara_mcp.py": "# compiled",
+            },
+        )
 
-        with ExitStack() as stack:
-            for p in self._patch_local(tmp_path):
-                stack.enter_context(p)
-            result = resolve_target("ai-tooling/setup-mekara-mcp")
+        search_levels.use_local(tmp_path)
+        result = resolve_target("ai-tooling/setup-mekara-mcp")
 
         assert result is not None
         assert result.name == "ai-tooling:setup-mekara-mcp"
-        assert "ai-tooling" in str(result.nl.path)
+        assert "ai-tooling" in result.nl.path.parts
         assert result.nl.path.name == "setup-mekara-mcp.md"
         assert result.compiled is not None
-        assert "ai_tooling" in str(result.compiled.path)
+        assert "ai_tooling" in result.compiled.path.parts
         assert result.compiled.path.name == "setup_mekara_mcp.py"
 
 
 class TestCanonicalName:
     """Tests for canonical name format with colons."""
 
-    def _patch_local(self, tmp_path: Path) -> tuple:
-        nl_levels = [SearchLevel(tmp_path / ".mekara" / "scripts" / "nl", ".md")]
-        compiled_levels = [SearchLevel(tmp_path / ".mekara" / "scripts" / "compiled", ".py")]
-        return (
-            patch("mekara.scripting.resolution._NL_SCRIPT_LEVELS", nl_levels),
-            patch("mekara.scripting.resolution._COMPILED_SCRIPT_LEVELS", compiled_levels),
-            patch("mekara.scripting.resolution._BUNDLED_BASE", tmp_path / "nonexistent"),
-        )
-
-    def test_name_uses_colons_for_path_separator(self, tmp_path: Path) -> None:
+    def test_name_uses_colons_for_path_separator(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Name should use colons as path separators."""
-        commands_path = tmp_path / ".mekara" / "scripts" / "nl" / "test"
-        commands_path.mkdir(parents=True)
-        (commands_path / "nested.md").write_text("# nested command")
+        write_tree(tmp_path / ".mekara" / "scripts", {"nl/test/nested.md": "# nested command"})
 
-        with ExitStack() as stack:
-            for p in self._patch_local(tmp_path):
-                stack.enter_context(p)
-            result = resolve_target("test/nested")
+        search_levels.use_local(tmp_path)
+        result = resolve_target("test/nested")
 
         assert result is not None
         assert result.name == "test:nested"
 
-    def test_hyphens_preserved_in_name(self, tmp_path: Path) -> None:
+    def test_hyphens_preserved_in_name(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Hyphens should be preserved in the canonical name."""
-        commands_path = tmp_path / ".mekara" / "scripts" / "nl"
-        commands_path.mkdir(parents=True)
-        (commands_path / "merge-main.md").write_text("# command")
+        write_tree(tmp_path / ".mekara" / "scripts", {"nl/merge-main.md": "# command"})
 
-        with ExitStack() as stack:
-            for p in self._patch_local(tmp_path):
-                stack.enter_context(p)
-            result = resolve_target("merge-main")
+        search_levels.use_local(tmp_path)
+        result = resolve_target("merge-main")
 
         assert result is not None
         assert result.name == "merge-main"
@@ -437,11 +377,12 @@ class TestCanonicalName:
 class TestNoProjectBehavior:
     """Tests for resolution when not in a project (no local level)."""
 
-    def test_skips_local_directories_when_no_project(self, tmp_path: Path) -> None:
+    def test_skips_local_directories_when_no_project(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Should not search local directories when not in a project."""
         user_commands = tmp_path / "user" / ".mekara" / "scripts" / "nl"
-        user_commands.mkdir(parents=True)
-        (user_commands / "mytest.md").write_text("# user command")
+        write_tree(user_commands, {"mytest.md": "# user command"})
 
         # No local level in the lists (simulates no project)
         nl_levels = [
@@ -452,22 +393,19 @@ class TestNoProjectBehavior:
             SearchLevel(tmp_path / "user" / ".mekara" / "scripts" / "compiled", ".py"),
             SearchLevel(tmp_path / "bundled" / "compiled", ".py"),
         ]
-        with (
-            patch("mekara.scripting.resolution._NL_SCRIPT_LEVELS", nl_levels),
-            patch("mekara.scripting.resolution._COMPILED_SCRIPT_LEVELS", compiled_levels),
-            patch("mekara.scripting.resolution._BUNDLED_BASE", tmp_path / "bundled"),
-        ):
-            result = resolve_target("mytest")
+        search_levels.set(nl=nl_levels, compiled=compiled_levels, bundled_base=tmp_path / "bundled")
+        result = resolve_target("mytest")
 
         assert result is not None
         assert result.nl.path == user_commands / "mytest.md"
         assert result.is_bundled is False
 
-    def test_finds_bundled_when_no_project(self, tmp_path: Path) -> None:
+    def test_finds_bundled_when_no_project(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Should find bundled targets when not in a project."""
         bundled_commands = tmp_path / "bundled" / "nl"
-        bundled_commands.mkdir(parents=True)
-        (bundled_commands / "document.md").write_text("# bundled command")
+        write_tree(bundled_commands, {"document.md": "# bundled command"})
 
         nl_levels = [
             SearchLevel(tmp_path / "nonexistent" / "nl", ".md"),
@@ -477,12 +415,8 @@ class TestNoProjectBehavior:
             SearchLevel(tmp_path / "nonexistent" / "compiled", ".py"),
             SearchLevel(tmp_path / "bundled" / "compiled", ".py"),
         ]
-        with (
-            patch("mekara.scripting.resolution._NL_SCRIPT_LEVELS", nl_levels),
-            patch("mekara.scripting.resolution._COMPILED_SCRIPT_LEVELS", compiled_levels),
-            patch("mekara.scripting.resolution._BUNDLED_BASE", tmp_path / "bundled"),
-        ):
-            result = resolve_target("document")
+        search_levels.set(nl=nl_levels, compiled=compiled_levels, bundled_base=tmp_path / "bundled")
+        result = resolve_target("document")
 
         assert result is not None
         assert result.target_type == Script.NATURAL_LANGUAGE
@@ -492,11 +426,12 @@ class TestNoProjectBehavior:
 class TestUserDirectoryExistenceCheck:
     """Tests for handling non-existent user directories."""
 
-    def test_skips_nonexistent_user_dirs(self, tmp_path: Path) -> None:
+    def test_skips_nonexistent_user_dirs(
+        self, tmp_path: Path, search_levels: SearchLevelsEnv
+    ) -> None:
         """Should skip user dirs if they don't exist."""
         bundled_commands = tmp_path / "bundled" / "nl"
-        bundled_commands.mkdir(parents=True)
-        (bundled_commands / "test.md").write_text("# bundled")
+        write_tree(bundled_commands, {"test.md": "# bundled"})
 
         nl_levels = [
             SearchLevel(tmp_path / "does_not_exist" / "nl", ".md"),
@@ -506,12 +441,8 @@ class TestUserDirectoryExistenceCheck:
             SearchLevel(tmp_path / "does_not_exist" / "compiled", ".py"),
             SearchLevel(tmp_path / "bundled" / "compiled", ".py"),
         ]
-        with (
-            patch("mekara.scripting.resolution._NL_SCRIPT_LEVELS", nl_levels),
-            patch("mekara.scripting.resolution._COMPILED_SCRIPT_LEVELS", compiled_levels),
-            patch("mekara.scripting.resolution._BUNDLED_BASE", tmp_path / "bundled"),
-        ):
-            result = resolve_target("test")
+        search_levels.set(nl=nl_levels, compiled=compiled_levels, bundled_base=tmp_path / "bundled")
+        result = resolve_target("test")
 
         assert result is not None
         assert result.nl.path == bundled_commands / "test.md"
@@ -27,28 +27,23 @@ class LoadScriptStub:
     ) -> None:
         self._real_loader = real_loader
         self._factories = factories
-        self._tmp_path = tmp_path
-        # Create directories for mock scripts
-        (tmp_path / "scripts").mkdir(parents=True, exist_ok=True)
-        (tmp_path / "commands").mkdir(parents=True, exist_ok=True)
+        # Paths are nominal: the stubbed script and its NL source live in memory.
+        # Targets are frozen, so one per name is built here and shared by every load.
+        self._targets = {
+            name: ResolvedTarget(
+                compiled=ScriptInfo(path=tmp_path / "scripts" / f"{name}.py", is_bundled=False),
+                nl=ScriptInfo(path=tmp_path / "commands" / f"{name}.md", is_bundled=False),
+                name=name,
+            )
+            for name in factories
+        }
 
     def __call__(self, name: str, request: str = "") -> LoadedScript:
         if name in self._factories:
             generator = self._factories[name](request)
-            # Create paths for mock target
-            compiled_path = self._tmp_path / "scripts" / f"{name}.py"
-            nl_path = self._tmp_path / "commands" / f"{name}.md"
-            # Create the NL file so it can be read
-            if not nl_path.exists():
-                nl_path.write_text(f"# Mock NL source for {name}")
-            target = ResolvedTarget(
-                compiled=ScriptInfo(path=compiled_path, is_bundled=False),
-                nl=ScriptInfo(path=nl_path, is_bundled=False),
-                name=name,
-            )
-            nl_source = nl_path.read_text()
+            nl_source = f"# Mock NL source for {name}"
             return LoadedCompiledScript(
-                target=target,
+                target=self._targets[name],
                 nl_source=nl_source,
                 prompt=nl_source,
                 generator=generator,
@@ -78,3 +73,12 @@ class ScriptLoaderStub:
         # Patch both in the source module and where it's imported
         self._monkeypatch.setattr(script_loading, "load_script", stub)
         self._monkeypatch.setattr(mcp_executor, "load_script", stub)
+
+
+def write_tree(root: Path, files: dict[str, str]) -> None:
+    """Create each distinct parent directory once, then write the files under root."""
+    paths = {root / relative: content for relative, content in files.items()}
+    for parent in {root, *(path.parent for path in paths)}:
+        parent.mkdir(parents=True, exist_ok=True)
+    for path, content in paths.items():
+        path.write_text(content)